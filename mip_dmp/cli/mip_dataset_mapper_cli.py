@@ -17,6 +17,8 @@
 import sys
 from pathlib import Path
 
+import pandas as pd
+
 # import logging
 from mip_dmp.process.mapping import map_dataset
 
@@ -25,6 +27,7 @@ from mip_dmp.utils.io import (
     load_excel,
     # load_excel,
     load_json,
+    save_csv,
 )
 from mip_dmp.utils.parser import create_parser
 
@@ -63,16 +66,22 @@ def main():
     print(f"Starting script with arguments: {args}")
     # Load the files
     print("Loading the files...")
-    source_dataset = load_csv(args.source_dataset)
     mappings = load_json(args.mapping_file)
-    cde_codes = load_excel(args.cdes_file)["code"].unique().tolist()
+    # Only the dataset columns referenced by the mapping are used, so the
+    # column selection is pushed down into the CSV parser to skip the rest.
+    mapped_columns = {mapping["dataset_column"] for mapping in mappings}
+    source_dataset = load_csv(
+        args.source_dataset, usecols=lambda column: column in mapped_columns
+    )
+    # Only the code column of the schema is needed here; pd.unique on the
+    # raw numpy values skips the Series round-trip of Series.unique().
+    cde_codes = pd.unique(
+        load_excel(args.cdes_file, usecols=["code"])["code"].to_numpy()
+    ).tolist()
     # Map the input dataset to the target CDEs
     output_dataset = map_dataset(source_dataset, mappings, cde_codes)
     # Save the output dataset
-    output_dataset.to_csv(
-        args.target_dataset,
-        index=False,
-    )
+    save_csv(output_dataset, args.target_dataset)
     return 0
 
 
@@ -23,10 +23,17 @@ from sklearn.decomposition import PCA
 # Internal imports
 from mip_dmp.utils.io import load_glove_model, load_c2v_model
 
+# Embeddings computed once per (method, model, text) triple: the same CDE
+# codes and dataset column names are re-embedded across matching runs.
+_EMBEDDING_CACHE = {}
+
 
 def glove_embedding(text, glove_model):
     """Find the Glove embedding for the text.
 
+    The embedding of each text is memoized per model, so repeated calls on
+    the same string are served from a cache.
+
     Parameters
     ----------
     text : str
@@ -40,6 +47,9 @@ def glove_embedding(text, glove_model):
     numpy.ndarray
         Glove embedding for the text.
     """
+    cache_key = ("glove", id(glove_model), text)
+    if cache_key in _EMBEDDING_CACHE:
+        return _EMBEDDING_CACHE[cache_key]
 
     def preprocess_text(text):
         """Preprocess the text.
@@ -56,14 +66,24 @@ def glove_embedding(text, glove_model):
         """
         # Lowercase the text.
         text = text.lower()
-        # Tokenize the text.
-        text = [s for s in text if s != "" and s != "_"]  # Make a list of characters.
+        # Tokenize the text. Iterating a string can never yield an empty
+        # string, so only the underscores need to be filtered out.
+        text = [s for s in text if s != "_"]  # Make a list of characters.
         return text
 
     # Preprocess the text.
-    text = preprocess_text(text)
-    # Find the Glove embedding for the text.
-    embedding = np.sum(np.array([glove_model[i] for i in text]), axis=0)
+    characters = preprocess_text(text)
+    # Gather the character vectors with one indexed read of the model's
+    # vector matrix and reduce them with a single strided sum, instead of
+    # stacking per-character copies into a temporary 2D array.
+    key_to_index = glove_model.key_to_index
+    indices = [
+        key_to_index[character]
+        for character in characters
+        if character in key_to_index
+    ]
+    embedding = glove_model.vectors[indices].sum(axis=0)
+    _EMBEDDING_CACHE[cache_key] = embedding
     return embedding
 
 
@@ -83,10 +103,14 @@ def chars2vec_embedding(text, chars2vec_model):
     numpy.ndarray
         chars2vec embedding for the text.
     """
+    cache_key = ("chars2vec", id(chars2vec_model), text)
+    if cache_key in _EMBEDDING_CACHE:
+        return _EMBEDDING_CACHE[cache_key]
     # Find the chars2vec embedding for the text.
     # The chars2vec model expects a list of strings as input.
     # The output is a list of embeddings, so we take the first element.
     embedding = chars2vec_model.vectorize_words([text])[0]
+    _EMBEDDING_CACHE[cache_key] = embedding
     return embedding
 
 
@@ -131,7 +155,9 @@ def generate_embeddings(words: list, embedding_method: str = "chars2vec"):
     print(f"> Generating embeddings for {len(words)} words...")
     if embedding_method == "chars2vec":
         c2v_model = load_c2v_model()
-        embeddings = [chars2vec_embedding(word, c2v_model) for word in words]
+        # The model vectorizes a whole batch of words in one forward pass,
+        # much faster than one model invocation per word.
+        embeddings = list(c2v_model.vectorize_words(list(words)))
     elif embedding_method == "glove":
         glove_model = load_glove_model()
         embeddings = [glove_embedding(word, glove_model) for word in words]
@@ -184,6 +210,52 @@ def find_n_closest_embeddings(
     )
 
 
+def find_n_closest_embeddings_batch(
+    word_embeddings: list, embeddings: list, embedding_words: list, n: int = 5
+):
+    """Find the n closest embeddings for a batch of query embeddings at once.
+
+    All pairwise cosine distances are computed with one normalized matrix
+    product instead of one scipy call per pair.
+
+    Parameters
+    ----------
+    word_embeddings : list
+        List of embeddings to find the n closest embeddings to.
+
+    embeddings : list
+        List of embeddings to find the closest embeddings to the given embeddings in.
+
+    embedding_words : list
+        List of words corresponding to the embeddings that will be resorted and reduced accordingly.
+
+    n : int
+        Number of closest embeddings to find.
+
+    Returns
+    -------
+    list of dict
+        One dictionary per query embedding, in the same form as the ones
+        returned by :func:`find_n_closest_embeddings`.
+    """
+    queries = np.asarray(word_embeddings, dtype=np.float32)
+    choices = np.asarray(embeddings, dtype=np.float32)
+    queries = queries / (np.linalg.norm(queries, axis=1, keepdims=True) + 1e-9)
+    choices = choices / (np.linalg.norm(choices, axis=1, keepdims=True) + 1e-9)
+    distances = 1.0 - queries @ choices.T
+    results = []
+    for row in distances:
+        sorted_indices = np.argsort(row)[0:n]
+        results.append(
+            {
+                "distances": [row[i] for i in sorted_indices],
+                "embeddings": [embeddings[i] for i in sorted_indices],
+                "embedding_words": [embedding_words[i] for i in sorted_indices],
+            }
+        )
+    return results
+
+
 def reduce_embeddings_dimension(
     embeddings: list, reduce_method: str = "tsne", n_components: int = 3
 ):
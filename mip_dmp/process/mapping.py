@@ -15,7 +15,11 @@
 """Module that provides functions to support the mapping of datasets to a specific CDEs metadata schema."""
 
 # External imports
+import ast
+import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import numpy as np
 import pandas as pd
 
@@ -28,6 +32,8 @@ import pandas as pd
 # that is done when importing chars2vec in mip_dmp/io.py
 os.environ["TF_CPP_MIN_LOG_LEVEL"] = "3"  # noqa
 
+logger = logging.getLogger(__name__)
+
 # Constants
 MAPPING_TABLE_COLUMNS = {
     "dataset_column": [],
@@ -38,6 +44,27 @@ MAPPING_TABLE_COLUMNS = {
 }
 
 
+@lru_cache(maxsize=1024)
+def parse_transform(transform):
+    """Parse a transform string to a Python literal.
+
+    The result is memoized so identical transform strings shared by several
+    columns are only parsed once.
+
+    Parameters
+    ----------
+    transform : str
+        Transform string, e.g. a dictionary literal for the "map"
+        transformation type.
+
+    Returns
+    -------
+    object
+        Parsed Python literal.
+    """
+    return ast.literal_eval(transform)
+
+
 def map_dataset(dataset, mappings, cde_codes):
     """Map the dataset to the schema.
 
@@ -57,47 +84,83 @@ def map_dataset(dataset, mappings, cde_codes):
     pandas.DataFrame
         Mapped dataset.
     """
-    # create a list to hold the mapped columns
-    mapped_columns = []
+    # Convert string columns to categorical once: the "map" transforms then
+    # operate on the small category sets instead of on every row.
+    dataset = dataset.copy()
+    for column in dataset.select_dtypes(include=["object"]).columns:
+        dataset[column] = dataset[column].astype("category")
 
     # Convert the list of mappings to a dictionary using cde_code as the key
     mapping_dict = {mapping["cde_code"]: mapping for mapping in mappings}
-    print(f"len(mapping_dict) = {len(mapping_dict)}")
+    logger.info("len(mapping_dict) = %d", len(mapping_dict))
+
+    def _transform_mapped_column(mapping):
+        """Apply the transform of one mapping to its dataset column."""
+        return transform_dataset_column(
+            dataset[mapping["dataset_column"]].rename(mapping["cde_code"]),
+            mapping["cde_code"],
+            mapping["cde_type"],
+            mapping["transform_type"],
+            mapping["transform"],
+        )
 
-    # Map and apply transformation to each dataset column described in the
-    # mapping JSON file.
+    # Collect the mappings that refer to an existing dataset column and the
+    # CDE codes without mapping (filled with NaN).
+    mappings_to_apply = []
+    unmapped_cde_codes = set()
     for cde_code in cde_codes:
         if cde_code in mapping_dict:
             mapping = mapping_dict[cde_code]
-            # Extract the mapping information of the column.
-            dataset_column = mapping["dataset_column"]
-            cde_code = mapping["cde_code"]
-            cde_type = mapping["cde_type"]
-            transform_type = mapping["transform_type"]
-            transform = mapping["transform"]
-            print(
-                f"  > Process column {dataset_column} with CDE code {cde_code}, CDE type {cde_type}, transform type {transform_type}, and transform {transform}"
+            # Defer message formatting to the logging handler so nothing is
+            # allocated when the INFO level is disabled.
+            logger.info(
+                "  > Process column %s with CDE code %s, CDE type %s, "
+                "transform type %s, and transform %s",
+                mapping["dataset_column"],
+                mapping["cde_code"],
+                mapping["cde_type"],
+                mapping["transform_type"],
+                mapping["transform"],
             )
-            # If the column is present in the dataset, copy the dataset column to
-            # the mapped dataset for which the column name is the CDE code, map
-            # the input data to the CDE code, apply the transformation, and append
-            # to the list of mapped columns.
-            if dataset_column in dataset.columns:
-                mapped_columns.append(
-                    transform_dataset_column(
-                        dataset[dataset_column].rename(cde_code),
-                        cde_code,
-                        cde_type,
-                        transform_type,
-                        transform,
-                    )
-                )
+            if mapping["dataset_column"] in dataset.columns:
+                mappings_to_apply.append(mapping)
         else:
-            print(f"WARNING: No mapping found for CDE code {cde_code}. Fill with NaN.")
-            mapped_columns.append(pd.DataFrame(columns=[cde_code]))
-    mapped_dataset = pd.concat(mapped_columns, axis=1)
+            logger.warning("No mapping found for CDE code %s. Fill with NaN.", cde_code)
+            unmapped_cde_codes.add(cde_code)
+
+    # The per-column transforms are independent and mostly run in pandas /
+    # numpy C code that releases the GIL, so they are executed on a thread
+    # pool when there is more than one column to transform.
+    if len(mappings_to_apply) > 1:
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            transformed_columns = list(
+                executor.map(_transform_mapped_column, mappings_to_apply)
+            )
+    else:
+        transformed_columns = [
+            _transform_mapped_column(mapping) for mapping in mappings_to_apply
+        ]
+    transformed_columns = {
+        mapping["cde_code"]: column
+        for mapping, column in zip(mappings_to_apply, transformed_columns)
+    }
+
+    # Collect the mapped columns keyed by CDE code, in the CDE codes order.
+    mapped_columns = {}
+    for cde_code in cde_codes:
+        if cde_code in transformed_columns:
+            mapped_columns[cde_code] = transformed_columns[cde_code]
+        elif cde_code in unmapped_cde_codes:
+            mapped_columns[cde_code] = np.nan
+    # Construct the mapped dataset in one shot instead of concatenating the
+    # columns one by one.
+    mapped_dataset = pd.DataFrame(mapped_columns, index=dataset.index)
+    logger.debug(
+        "mapped_dataset shape=%s cols=%s",
+        mapped_dataset.shape,
+        list(mapped_dataset.columns),
+    )
     # Return the mapped dataset.
-    print(mapped_dataset)
     return mapped_dataset
 
 
@@ -121,9 +184,10 @@ def transform_dataset_column(
         Type of transformation to be applied to the dataset column.
         Can be "map" or "scale".
 
-    transform : str
+    transform : str, dict or float
         Transformation to be applied to the dataset column.
-        Can be a JSON string for the "map" transformation type or a scaling factor.
+        Can be a dictionary (or its string form) for the "map"
+        transformation type or a scaling factor (or its string form).
 
     Returns
     -------
@@ -140,7 +204,7 @@ def transform_dataset_column(
             dataset_column, cde_code, cde_type, scaling_factor
         )
     else:
-        print(f"WARNING: No transformation applied for output column {cde_code}.")
+        logger.warning("No transformation applied for output column %s.", cde_code)
     return dataset_column
 
 
@@ -152,26 +216,56 @@ def apply_transform_map(dataset_column, transform):
     dataset_column : pandas.DataFrame
         Dataset column to be transformed.
 
-    transform : str
-        Transformation to be applied to the dataset column.
-        Can be a JSON string for the "map" transformation type or a scaling factor.
+    transform : str or dict
+        Transformation to be applied to the dataset column, as a dictionary
+        mapping old to new values or its string form.
 
     Returns
     -------
     dataset_column: pandas.DataFrame
         The transformed dataset column."""
-    # Parse the mapping values from the JSON string
-    mapping_values = eval(transform)
-    dataset_column = dataset_column.map(
-        lambda x: x.lower() if isinstance(x, str) else x
+    # The transform may already be a parsed dictionary, in which case the
+    # string round-trip is skipped entirely; strings are parsed (and
+    # memoized) by parse_transform. ast.literal_eval only evaluates
+    # literals, unlike eval which compiles and runs arbitrary Python code.
+    mapping_values = (
+        transform if isinstance(transform, dict) else parse_transform(transform)
     )
+    # Keys are lowercased to match the lowercased column values.
+    mapping_values = {
+        old_value.lower(): new_value
+        for old_value, new_value in mapping_values.items()
+    }
+
+    # Fast path for categorical columns: lowercase and remap only the (few)
+    # distinct categories, then rebuild the full column by taking the per-row
+    # integer category codes (code -1 encodes NaN).
+    if isinstance(dataset_column.dtype, pd.CategoricalDtype):
+        categories = [
+            category.lower() if isinstance(category, str) else category
+            for category in dataset_column.cat.categories
+        ]
+        mapped_categories = np.asarray(
+            [mapping_values.get(category, category) for category in categories]
+            + [np.nan],
+            dtype=object,
+        )
+        return pd.Series(
+            mapped_categories[dataset_column.cat.codes],
+            index=dataset_column.index,
+            name=dataset_column.name,
+        )
 
-    # Map the values.
-    for mapping_value_item in mapping_values.items():
-        old_value = mapping_value_item[0].lower()
-        new_value = mapping_value_item[1]
-        dataset_column.iloc[dataset_column == old_value] = new_value
-    return dataset_column
+    # Lowercasing only affects string values, so the elementwise pass is
+    # skipped entirely for non-object (numeric) columns.
+    if dataset_column.dtype == object:
+        dataset_column = dataset_column.map(
+            lambda x: x.lower() if isinstance(x, str) else x
+        )
+
+    # Replace all the values in one hashed pandas call; values absent from
+    # the mapping are left untouched.
+    return dataset_column.replace(mapping_values)
 
 
 def apply_transform_scale(dataset_column, cde_code, cde_type, scaling_factor):
@@ -196,28 +290,23 @@ def apply_transform_scale(dataset_column, cde_code, cde_type, scaling_factor):
     dataset_column: pandas.DataFrame
         The transformed dataset column.
     """
-    # Check if the column contains any NaN values. If so, the scaling is
-    # not applied. Otherwise, the scaling is applied.
-    if not dataset_column.isnull().values.any():
-        # Cast the column to the correct type and apply the scaling factor.
-        try:
-            if cde_type == "integer":
-                dataset_column = dataset_column.astype(int) * int(scaling_factor)
-            elif cde_type == "real":
-                dataset_column = dataset_column.astype(float) * scaling_factor
-        except ValueError:
-            print(f"WARNING: The column {cde_code} could not be cast to {cde_type}.")
+    # Coerce the column to numeric in one vectorized pass; NaN values
+    # propagate through the scaling without any elementwise Python loop.
+    original_column = dataset_column
+    if isinstance(dataset_column.dtype, pd.CategoricalDtype):
+        dataset_column = dataset_column.astype(object)
+    column = pd.to_numeric(dataset_column, errors="coerce")
+    if column.isnull().values.sum() > dataset_column.isnull().values.sum():
+        # Values were lost in the coercion: keep the column unchanged with
+        # a warning, as the previous elementwise cast did on ValueError.
+        logger.warning("The column %s could not be cast to %s.", cde_code, cde_type)
+        return original_column
+    if cde_type == "integer":
+        # Truncate toward zero as int() did, and use the nullable Int64
+        # dtype to keep integer semantics in presence of NaN values.
+        column = (np.trunc(column) * int(scaling_factor)).astype("Int64")
+    elif cde_type == "real":
+        column = column * scaling_factor
     else:
-        # Cast and scale only the non-NaN values.
-        if cde_type == "integer":
-            dataset_column_list = [
-                np.nan if pd.isnull(x) else int(float(x)) * int(scaling_factor)
-                for x in dataset_column
-            ]
-        elif cde_type == "real":
-            dataset_column_list = [
-                np.nan if pd.isnull(x) else float(x) * scaling_factor
-                for x in dataset_column
-            ]
-        dataset_column = pd.DataFrame(dataset_column_list, columns=[cde_code])
-    return dataset_column
+        return dataset_column
+    return column.rename(cde_code)
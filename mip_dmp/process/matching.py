@@ -18,16 +18,58 @@
 import ast
 import numpy as np
 import pandas as pd
-from fuzzywuzzy import fuzz
+from rapidfuzz import fuzz, process
 
 # Internal imports
-from mip_dmp.process.mapping import MAPPING_TABLE_COLUMNS
 from mip_dmp.process.embedding import (
     generate_embeddings,
-    find_n_closest_embeddings,
+    find_n_closest_embeddings_batch,
 )
 from mip_dmp.process.utils import is_number
 
+# Translation table applied to the raw "values" cell of the schema to
+# normalize problematic quote characters and strip the surrounding brackets
+# in a single C-level pass over the string.
+CDE_VALUES_TRANSLATION_TABLE = str.maketrans(
+    {
+        "“": '"',
+        "”": '"',
+        "[": None,
+        "]": None,
+    }
+)
+
+
+def _top_k_indices(scores, k):
+    """Return the indices of the k highest scores in decreasing order.
+
+    argpartition selects the k best entries in O(n) before only that
+    slice is sorted, instead of sorting the full score vector.
+
+    Parameters
+    ----------
+    scores : numpy.ndarray
+        One-dimensional score vector.
+
+    k : int
+        Number of indices to return.
+
+    Returns
+    -------
+    numpy.ndarray
+        Indices of the k highest scores, best first.
+    """
+    k = min(k, scores.shape[-1])
+    if k == scores.shape[-1]:
+        return np.argsort(-scores, kind="stable")
+    top = np.argpartition(-scores, k - 1)[:k]
+    # A stable sort of the argpartition slice would only be stable with
+    # respect to its arbitrary intermediate order, so the selection is
+    # widened to every entry tied with the k-th score and ties are broken
+    # on the original index, reproducing the full-sort branch exactly.
+    candidates = np.flatnonzero(scores >= scores[top].min())
+    return candidates[np.lexsort((candidates, -scores[candidates]))][:k]
+
 
 def match_columns_to_cdes(
     dataset,
@@ -38,7 +80,7 @@ def match_columns_to_cdes(
     """Initialize the mapping table by matching the dataset columns with the CDE codes.
 
     Different matching methods can be used:
-    - "fuzzy": Fuzzy matching using the Levenshtein distance. (https://github.com/seatgeek/thefuzz)
+    - "fuzzy": Fuzzy matching using the Levenshtein distance. (https://github.com/maxbachmann/RapidFuzz)
     - "glove": Embedding matching using Glove embeddings at the character level. (https://nlp.stanford.edu/projects/glove/)
     - "chars2vec": Embedding matching using Chars2Vec embeddings. (https://github.com/IntuitionEngineeringTeam/chars2vec)
 
@@ -87,10 +129,6 @@ def match_columns_to_cdes(
     schema_code_embeddings : list
         List of embedding vectors for the CDE codes.
     """
-    # Create the mapping table.
-    mapping_table = pd.DataFrame(MAPPING_TABLE_COLUMNS)
-    # Add the dataset columns.
-    mapping_table["dataset_column"] = dataset.columns
     # Initialize a dictionary to store the results of the
     # first 10 matched CDE codes for each dataset column.
     matched_cde_codes = {}
@@ -100,26 +138,19 @@ def match_columns_to_cdes(
             None,
             None,
         )  # Not used for fuzzy matching.
-        # Function to find the fuzzy matches for each dataset column.
-        matches = mapping_table["dataset_column"].apply(
-            lambda dataset_column: str(
-                sorted(
-                    schema["code"],
-                    key=lambda cde_code: fuzz.ratio(dataset_column, cde_code),
-                    reverse=True,
-                )[
-                    0:nb_kept_matches
-                ]  # Select the nb_kept_matches first matched CDE codes.
-            )
+        cde_codes = schema["code"].tolist()
+        # Compute all pairwise fuzzy ratios in a single C++ call parallelized
+        # over the CPU cores, instead of one Python-level sort per column.
+        scores = process.cdist(
+            dataset.columns, cde_codes, scorer=fuzz.ratio, workers=-1
         )
-        # Store the first nb_fuzzy_matches matched CDE codes in the dictionary.
+        # Store the first nb_kept_matches matched CDE codes in the dictionary.
         for i, dataset_column in enumerate(dataset.columns):
-            words = ast.literal_eval(matches.to_list()[i])
+            # Select the nb_kept_matches first matched CDE codes.
+            ranked_indices = _top_k_indices(scores[i], nb_kept_matches)
             matched_cde_codes[dataset_column] = {
-                "words": words,
-                "distances": [
-                    (1 - 0.01 * fuzz.ratio(dataset_column, match)) for match in words
-                ],
+                "words": [cde_codes[j] for j in ranked_indices],
+                "distances": [(1 - 0.01 * scores[i][j]) for j in ranked_indices],
                 "embeddings": [None] * nb_kept_matches,
             }
     elif matching_method == "chars2vec" or matching_method == "glove":
@@ -127,48 +158,77 @@ def match_columns_to_cdes(
             f"> Perform  {matching_method} embedding matching with {nb_kept_matches} matches per column."
         )
         dataset_column_embeddings, schema_code_embeddings = (
-            generate_embeddings(mapping_table["dataset_column"], matching_method),
+            generate_embeddings(list(dataset.columns), matching_method),
             generate_embeddings(schema["code"], matching_method),
         )
         print(f"> Find {nb_kept_matches} closest embeddings for each dataset column...")
-        n_closest_matches = [
-            find_n_closest_embeddings(
-                dataset_column_embedding,
-                schema_code_embeddings,
-                schema["code"],
-                nb_kept_matches,
-            )
-            for dataset_column_embedding in dataset_column_embeddings
-        ]
+        # One normalized matrix product scores every column against every
+        # CDE code, instead of one cosine call per (column, code) pair.
+        n_closest_matches = find_n_closest_embeddings_batch(
+            dataset_column_embeddings,
+            schema_code_embeddings,
+            schema["code"].tolist(),
+            nb_kept_matches,
+        )
         matched_cde_codes = {
             dataset_column: {
                 "words": n_closest_matches[i]["embedding_words"],
                 "distances": n_closest_matches[i]["distances"],
                 "embeddings": n_closest_matches[i]["embeddings"],
             }
-            for i, dataset_column in enumerate(mapping_table["dataset_column"])
+            for i, dataset_column in enumerate(dataset.columns)
         }
-    # Add the first matched CDE code for each dataset_column.
-    mapping_table["cde_code"] = [
+    # Take the first matched CDE code for each dataset column.
+    matched_codes = [
         matched_cde_codes[k]["words"][0] for k in matched_cde_codes.keys()
     ]
-    # Add the CDE type corresponding to the CDE code proposed by fuzzy matching.
-    mapping_table["cde_type"] = [
-        schema[schema["code"] == cde_code]["type"].iloc[0]
-        for cde_code in mapping_table["cde_code"]
-    ]
-    # Add the transform type based on the CDE type (integer, real, binominal, multinominal).
-    mapping_table["transform_type"] = [
-        "scale" if cde_type in ["integer", "real"] else "map"
-        for cde_type in mapping_table["cde_type"]
-    ]
-    # Add the transform.
-    mapping_table["transform"] = [
-        make_initial_transform(dataset, schema, dataset_column, cde_code)
-        for (dataset_column, cde_code) in zip(
-            mapping_table["dataset_column"], mapping_table["cde_code"]
+    # Index the schema columns by CDE code once into plain dicts so the
+    # lookups below are O(1) hashed accesses instead of one boolean scan
+    # of the schema per code.
+    code2type = dict(zip(schema["code"], schema["type"]))
+    code2values = dict(zip(schema["code"], schema["values"]))
+    # CDE type corresponding to the CDE code proposed by the matching.
+    cde_types = np.asarray(
+        [code2type.get(code) for code in matched_codes], dtype=object
+    )
+    # Transform type based on the CDE type (integer, real, binominal, multinominal).
+    transform_types = np.where(
+        np.isin(cde_types, ["integer", "real"]), "scale", "map"
+    )
+    # Compute the unique values of the nominal dataset columns once, so the
+    # transform generation below does not re-scan any column. The string
+    # cast runs vectorized over the column (NaN becomes the "nan" string
+    # the transform logic expects) instead of one format call per value.
+    column_unique_values = {
+        dataset_column: dataset[dataset_column].astype(str).unique().tolist()
+        for dataset_column, transform_type in zip(
+            dataset.columns, transform_types
+        )
+        if transform_type == "map"
+    }
+    transforms = [
+        make_initial_transform(
+            dataset,
+            schema,
+            dataset_column,
+            cde_code,
+            dataset_column_values=column_unique_values.get(dataset_column),
+            code2type=code2type,
+            code2values=code2values,
         )
+        for (dataset_column, cde_code) in zip(dataset.columns, matched_codes)
     ]
+    # Build the mapping table in a single DataFrame construction with
+    # contiguous allocations, instead of growing it column by column.
+    mapping_table = pd.DataFrame(
+        {
+            "dataset_column": dataset.columns,
+            "cde_code": matched_codes,
+            "cde_type": cde_types,
+            "transform_type": transform_types,
+            "transform": transforms,
+        }
+    )
     return (
         mapping_table,
         matched_cde_codes,
@@ -177,7 +237,15 @@ def match_columns_to_cdes(
     )
 
 
-def make_initial_transform(dataset, schema, dataset_column, cde_code):
+def make_initial_transform(
+    dataset,
+    schema,
+    dataset_column,
+    cde_code,
+    dataset_column_values=None,
+    code2type=None,
+    code2values=None,
+):
     """Make the initial transform.
 
     Parameters
@@ -194,13 +262,30 @@ def make_initial_transform(dataset, schema, dataset_column, cde_code):
     cde_code : str
         CDE code.
 
+    dataset_column_values : list of str, optional
+        Precomputed unique values of the dataset column as strings. When
+        None, they are extracted from the dataset.
+
+    code2type : dict, optional
+        Mapping of CDE code to CDE type, so repeated calls share O(1)
+        hashed lookups instead of re-scanning the schema. When None, it is
+        derived from the schema.
+
+    code2values : dict, optional
+        Mapping of CDE code to the raw "values" cell of the schema. When
+        None, it is derived from the schema.
+
     Returns
     -------
     dict
         Initial transform.
     """
+    if code2type is None:
+        code2type = dict(zip(schema["code"], schema["type"]))
+    if code2values is None:
+        code2values = dict(zip(schema["code"], schema["values"]))
     # Get the CDE type.
-    cde_type = schema[schema["code"] == cde_code]["type"].iloc[0]
+    cde_type = code2type[cde_code]
     # Make the initial transform.
     if cde_type in ["integer", "real"]:
         return "1.0"
@@ -208,22 +293,21 @@ def make_initial_transform(dataset, schema, dataset_column, cde_code):
         # Extract the string CDE code encoded / text values from the corresponding cell of
         # the "values" column of the schema, and format it as a dictionary of the form:
         # {encoded_value_1: text_value_1, encoded_value_2: text_value_2, ...}
-        cde_code_values_str = (
-            f'[{schema[schema["code"] == cde_code]["values"].iloc[0]}]'
+        cde_code_values_str = f"[{code2values[cde_code]}]"
+        # Replace problematic characters and remove surrounding brackets
+        # in one pass over the string.
+        cde_code_values_str = cde_code_values_str.translate(
+            CDE_VALUES_TRANSLATION_TABLE
         )
-        # Replace problematic characters.
-        cde_code_values_str = cde_code_values_str.replace("“", '"')
-        cde_code_values_str = cde_code_values_str.replace("”", '"')
-        # Remove surrounding brackets
-        cde_code_values_str = cde_code_values_str.replace("[", "")
-        cde_code_values_str = cde_code_values_str.replace("]", "")
-        # Convert the string to a dictionary.
-        cde_code_values_dict = eval(cde_code_values_str)
-        # Get the unique values of the dataset column and make sure they are strings.
-        dataset_column_values = [
-            f"{str(dataset_column_value)}"
-            for dataset_column_value in dataset[dataset_column].unique()
-        ]
+        # Convert the string to a dictionary. ast.literal_eval only accepts
+        # literals, unlike eval which runs arbitrary Python code.
+        cde_code_values_dict = ast.literal_eval(cde_code_values_str)
+        # Get the unique values of the dataset column and make sure they are
+        # strings, unless they were already precomputed by the caller.
+        if dataset_column_values is None:
+            dataset_column_values = (
+                dataset[dataset_column].astype(str).unique().tolist()
+            )
         # Extract the CDE code encoded / text values from the dictionary
         # previously created.
         if any(is_number(s) for s in dataset_column_values):
@@ -272,32 +356,37 @@ def generate_initial_transform(dataset_column_values, cde_code_values, dataset_c
     initial_transform : str
         Initial transform.
     """
-    # Handle the case where the dataset column values are all NaN.
-    if (
-        len(dataset_column_values) == 1
-        and dataset_column_values[0] == "nan"
-        and ("nan" not in cde_code_values)
-    ):
-        print(f"WARNING: The dataset column {dataset_column} has only one NaN value.")
+    # Handle the case where the dataset column values are all NaN, with one
+    # compiled numpy comparison instead of separate membership and count
+    # scans of the list.
+    values_array = np.asarray(dataset_column_values)
+    if bool(np.all(values_array == "nan")):
+        print(f"WARNING: The dataset column {dataset_column} has only NaN values.")
         return "nan"
-    elif "nan" in dataset_column_values:
-        nb_nan_values = dataset_column_values.count("nan")
-        if nb_nan_values == len(dataset_column_values):
-            print(f"WARNING: The dataset column {dataset_column} has only NaN values.")
-            return "nan"
     # Handle the case where we have the same number of dataset column values
     # and CDE code values.
     if len(dataset_column_values) == len(cde_code_values):
-        # Fuzzy match dataset column values to the CDE code values
-        cde_code_values = [
-            sorted(
-                cde_code_values,
-                key=lambda cde_code_value, dataset_column_value=dataset_column_value: fuzz.ratio(
-                    dataset_column_value, cde_code_value
-                ),
-                reverse=True,
-            )[0]
+        # Fast path: when every dataset value already equals a CDE code value
+        # (common when the mapper is re-run on an already curated dataset),
+        # each value maps to itself and the fuzzy scoring can be skipped.
+        cde_code_value_set = set(cde_code_values)
+        if all(
+            dataset_column_value in cde_code_value_set
             for dataset_column_value in dataset_column_values
+        ):
+            return str(
+                {
+                    f"{dataset_column_value}": f"{dataset_column_value}"
+                    for dataset_column_value in dataset_column_values
+                }
+            )
+        # Fuzzy match dataset column values to the CDE code values with one
+        # batched score-matrix call instead of one Python sort per value.
+        scores = process.cdist(
+            dataset_column_values, cde_code_values, scorer=fuzz.ratio
+        )
+        cde_code_values = [
+            cde_code_values[index] for index in scores.argmax(axis=1)
         ]
         return str(
             {
@@ -389,10 +478,11 @@ def match_column_to_cdes(
     list
         List of matched CDE codes ordered by decreasing fuzzy ratio.
     """
-    # Function to find the fuzzy matches for each dataset column.
-    matches = sorted(
-        schema["code"],
-        key=lambda cde_code: fuzz.ratio(dataset_column, cde_code),
-        reverse=True,
-    )
-    return matches
+    # Score the column against all CDE codes in one batched C++ call
+    # instead of one Python-level fuzz.ratio call per code.
+    cde_codes = schema["code"].tolist()
+    scores = process.cdist([dataset_column], cde_codes, scorer=fuzz.ratio)[0]
+    # A stable sort keeps the schema order for equal scores, matching the
+    # previous sorted() behavior.
+    ranked_indices = np.argsort(-scores, kind="stable")
+    return [cde_codes[index] for index in ranked_indices]
@@ -17,11 +17,22 @@
 # External imports
 import ast
 import os
-import json
+from functools import lru_cache
+from importlib import resources
 from pathlib import Path
 import pandas as pd
 from PySide2.QtGui import QIcon
-from PySide2.QtCore import Qt, QRect, QMetaObject, QCoreApplication, QSize
+from PySide2.QtCore import (
+    Qt,
+    QRect,
+    QMetaObject,
+    QCoreApplication,
+    QObject,
+    QRunnable,
+    QSize,
+    QThreadPool,
+    Signal,
+)
 from PySide2.QtWidgets import (
     QAction,
     QWidget,
@@ -45,7 +56,28 @@ from PySide2.QtWidgets import (
     QVBoxLayout,
     QInputDialog,
 )
-import pkg_resources
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # Fall back to the pandas CSV reader.
+    pa = None
+    pacsv = None
+
+try:
+    import orjson
+except ImportError:  # Fall back to the pandas JSON writer.
+    orjson = None
+
+try:
+    import pyarrow.feather as feather
+except ImportError:  # The mapping is then saved/loaded as JSON only.
+    feather = None
+
+try:
+    import python_calamine
+except ImportError:
+    python_calamine = None
 
 # Internal imports
 from mip_dmp.utils.io import load_mapping_json
@@ -58,6 +90,7 @@ from mip_dmp.process.matching import (
 )
 from mip_dmp.qt5.model.table_model import (
     # NoEditorDelegate,
+    LazyPandasTableModel,
     PandasTableModel,
 )
 from mip_dmp.qt5.components.embedding_visualization_widget import (
@@ -70,95 +103,223 @@ from mip_dmp.qt5.components.matching_visualization_widget import (
 # Constants
 WINDOW_NAME = "MIP Dataset Mapper"
 NB_KEPT_MATCHES = 819  # for all FERES variables
+# Dialog filter for the mapping file, offering the columnar Feather format
+# (fast, dtype-preserving round-trip) next to JSON when pyarrow is installed.
+MAPPING_FILE_FILTER = (
+    "JSON files (*.json);;Feather files (*.feather)"
+    if feather is not None
+    else "JSON files (*.json)"
+)
+# Fall back to the default openpyxl reader when calamine is not installed.
+_EXCEL_ENGINE = "calamine" if python_calamine is not None else None
+
+
+def _asset(name):
+    """Return the filesystem path of a bundled Qt asset.
+
+    importlib.resources resolves the packaged path in O(1) after the
+    first call, without the metadata walk pkg_resources used to do.
+
+    Parameters
+    ----------
+    name : str
+        File name of the asset under ``mip_dmp/qt5/assets``.
+
+    Returns
+    -------
+    str
+        Absolute path of the asset.
+    """
+    return str(resources.files("mip_dmp") / "qt5" / "assets" / name)
+
+
+# Icons decoded once per process, keyed by asset file name.
+_ICONS = {}
+
+
+def _icon(name):
+    """Return the cached QIcon of a bundled asset, decoding it only once.
+
+    Parameters
+    ----------
+    name : str
+        File name of the icon under ``mip_dmp/qt5/assets``.
+
+    Returns
+    -------
+    QIcon
+        The decoded icon, shared across window constructions.
+    """
+    if name not in _ICONS:
+        _ICONS[name] = QIcon(_asset(name))
+    return _ICONS[name]
+
+
+def _configure_table_view(tableView):
+    """Apply fixed row heights and per-pixel scrolling to a table view.
+
+    With a Fixed vertical resize mode Qt no longer measures every row to
+    compute the view geometry, which keeps scrolling smooth regardless of
+    how many rows the bound model exposes.
+
+    Parameters
+    ----------
+    tableView : QTableView
+        The table view to configure.
+    """
+    verticalHeader = tableView.verticalHeader()
+    verticalHeader.setSectionResizeMode(QHeaderView.Fixed)
+    verticalHeader.setDefaultSectionSize(tableView.fontMetrics().height() + 4)
+    tableView.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+    tableView.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+    tableView.setWordWrap(False)
+
+
+def _read_excel(excel_file):
+    """Read an Excel file with the calamine engine when available.
+
+    The Rust-based calamine reader parses spreadsheets an order of magnitude
+    faster than the pure-Python openpyxl walker; openpyxl remains the
+    fallback when python-calamine is not installed.
+
+    Parameters
+    ----------
+    excel_file : str
+        Path to Excel file.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Dataframe loaded from the Excel file.
+    """
+    # The CDE codes must stay strings (purely numeric codes would
+    # otherwise be inferred as integers); declaring the dtype up front
+    # also skips the per-column type inference.
+    dtype = {"code": str}
+    if _EXCEL_ENGINE is not None:
+        return pd.read_excel(excel_file, engine=_EXCEL_ENGINE, dtype=dtype)
+    return pd.read_excel(excel_file, dtype=dtype)
+
+
+@lru_cache(maxsize=1)
+def _load_stylesheet():
+    """Read the window Qt Style Sheet, once per process."""
+    return (
+        resources.files("mip_dmp") / "qt5" / "assets" / "stylesheet.qss"
+    ).read_text()
+
+
+def _shrink_object_columns(df):
+    """Convert low-cardinality object columns of a frame to the category dtype.
+
+    Object columns store every value as an individual Python string, which can
+    be several times larger than the dictionary-encoded category dtype and
+    slows down every model data() call. Columns where more than half of the
+    values are distinct are left untouched.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Dataframe updated in place.
+    """
+    if len(df) == 0:
+        return
+    for column in df.select_dtypes(include=["object"]).columns:
+        if df[column].nunique(dropna=True) / len(df) < 0.5:
+            df[column] = df[column].astype("category")
+
+
+class _BackgroundTaskSignals(QObject):
+    """Signals emitted by a background task run on the thread pool."""
+
+    finished = Signal(object)
+    error = Signal(str)
+
+
+class _BackgroundTask(QRunnable):
+    """Run a function on the thread pool and report its result via signals."""
+
+    def __init__(self, fn):
+        """Initialize the task.
+
+        Parameters
+        ----------
+        fn : callable
+            Function executed on the thread pool. Its return value is
+            emitted by the finished signal.
+        """
+        super(_BackgroundTask, self).__init__()
+        self.fn = fn
+        self.signals = _BackgroundTaskSignals()
+
+    def run(self):
+        """Execute the function and emit its result or the error message."""
+        try:
+            result = self.fn()
+        except Exception as e:
+            self.signals.error.emit(repr(e))
+        else:
+            self.signals.finished.emit(result)
 
 
 class MIPDatasetMapperWindow(object):
     """Class for the main window of the MIP Dataset Mapper UI application."""
 
+    # Only the data-carrying attributes are slotted; the Qt widgets and
+    # layouts live in the regular instance __dict__ (their lifetime is owned
+    # by Qt through the parent pointers anyway).
     __slots__ = [
+        "__dict__",
+        # Kept on purpose: PySide2 holds weak references to Python receivers
+        # when bound methods of this class are connected to signals.
         "__weakref__",
-        "centralWidgetGridLayout",
-        "centralWidgetSplitter",
-        "centralwidget",
-        "columnsCDEsMappingGroupBox",
-        "columnsCDEsMappingGroupBoxLayout",
-        "columnsCDEsMappingSplitter",
-        "inputDatasetFormLayout",
-        "inputDatasetFormLayoutWidget",
-        "inputDatasetGroupBox",
-        "inputDatasetGroupBoxLayout",
-        "inputDatasetLoadButton",
-        "inputDatasetPathLabel",
-        "inputDatasetTableView",
-        "leftCentralWidgetSplitter",
-        "mapButton",
-        "mappingFilePathLabel",
-        "mappingFormLayout",
-        "mappingFormLayoutWidget",
-        "mappingLoadButton",
-        "mappingSaveButton",
-        "mappingCheckButton",
-        "mappingTableView",
-        "outputDirectoryLabel",
-        "outputDirectorySelectButton",
-        "outputFilenameLabel",
-        "outputFilenameSelectButton",
-        "outputFormLayout",
-        "outputFormLayoutWidget",
-        "outputGroupBox",
-        "outputGroupBoxLayout",
-        "rightCentralWidgetSplitter",
-        "targetCDEsFormLayout",
-        "targetCDEsFormLayoutWidget",
-        "targetCDEsGroupBox",
-        "targetCDEsGroupBoxLayout",
-        "targetCDEsLoadButton",
-        "targetCDEsPathLabel",
-        "targetCDEsTableView",
-        "inputDatasetPath",
         "inputDataset",
         "inputDatasetColumns",
         "inputDatasetPandasModel",
-        "targetCDEsPath",
+        "inputDatasetPath",
         "targetCDEs",
         "targetCDEsPandasModel",
-        "mappingFilePath",
+        "targetCDEsPath",
         "columnsCDEsMappingData",
         "columnsCDEsMappingPandasModel",
-        "mappingTableRowUpdateGroupBox",
-        "mappingTableRowUpdateGroupBoxLayout",
-        "mappingRowIndex",
-        "mappingTableViewWidget",
-        "mappingTableViewLayout",
-        "mappingTableViewAddDeleteRowWidget",
-        "mappingTableViewAddDeleteRowLayout",
-        "mappingTableViewAddRowButton",
-        "mappingTableViewDeleteRowButton",
-        "datasetColumn",
-        "cdeCode",
-        "cdeType",
-        "transformType",
-        "transform",
+        "mappingFilePath",
         "matchedCdeCodes",
-        "updateMappingRowButton",
-        "outputDirectoryPath",
-        "outputFilename",
-        "statusbar",
-        "toolBar",
-        "mappingInitLabel",
-        "initMatchingMethod",
-        "mappingInitButton",
-        "embeddingVizButton",
-        "embeddingFigure",
-        "embeddingWidget",
-        "embeddingWidgetLayout",
-        "embeddingCanvas",
         "inputDatasetColumnEmbeddings",
         "targetCDEsEmbeddings",
-        "matchingVizButton",
-        "matchingWidget",
+        "outputFilename",
+        "_pendingTasks",
+        "_datasetReady",
+        "_cdesReady",
+        "_cdeTypeByCode",
+        "_lastMatchKey",
     ]
 
+    # (widget attribute, setter, source text) triples consumed by
+    # retranslateUi in a single loop.
+    _TEXTS = (
+        ("inputDatasetGroupBox", "setTitle", "Source Dataset"),
+        (
+            "inputDatasetPathLabel",
+            "setText",
+            "<Please load a source dataset file in .csv format...>",
+        ),
+        ("targetCDEsGroupBox", "setTitle", "Target CDEs Metadata Schema"),
+        (
+            "targetCDEsPathLabel",
+            "setText",
+            "<Please load a CDEs metadata schema file in .xlxs format>",
+        ),
+        ("columnsCDEsMappingGroupBox", "setTitle", "Columns / CDEs Mapping"),
+        (
+            "mappingFilePathLabel",
+            "setText",
+            "<Please save/ load a Columns / CDEs mapping file in .json format...>",
+        ),
+        ("mappingTableViewAddRowButton", "setText", "Add"),
+        ("mappingTableViewDeleteRowButton", "setText", "Delete"),
+        ("mappingTableRowUpdateGroupBox", "setTitle", "Mapping Row Editor"),
+    )
+
     def __init__(self, mainWindow):
         """Initialize the main window of the MIP Dataset Mapper UI application.
 
@@ -167,6 +328,14 @@ class MIPDatasetMapperWindow(object):
         mainWindow : QMainWindow
             The main window of the application.
         """
+        # Keep the pending background tasks alive until they report back
+        self._pendingTasks = []
+        # Readiness flags set once the dataset / CDEs schema are loaded
+        self._datasetReady = False
+        self._cdesReady = False
+        # Key of the last successful matching run, used to skip
+        # re-matching unchanged inputs
+        self._lastMatchKey = None
         # Adjust the window size, Qt Style Sheet, and title
         self.adjustWindow(mainWindow)
         # Create the UI components
@@ -202,19 +371,16 @@ class MIPDatasetMapperWindow(object):
             The main window of the application.
         """
         if not mainWindow.objectName():
-            mainWindow.setObjectName(f"{WINDOW_NAME}")
+            mainWindow.setObjectName(WINDOW_NAME)
         mainWindow.resize(1280, 720)
-        # Set the window Qt Style Sheet
-        styleSheetFile = pkg_resources.resource_filename(
-            "mip_dmp", os.path.join("qt5", "assets", "stylesheet.qss")
-        )
-        with open(styleSheetFile, "r") as fh:
-            mainWindow.setStyleSheet(fh.read())
+        # Set the window Qt Style Sheet, resolved and read only once per
+        # process instead of one filesystem read per window.
+        mainWindow.setStyleSheet(_load_stylesheet())
         # Set the window icon
         # mainWindow.setWindowIcon(QIcon(":/images/mip_logo.png"))
         # Set the window title
         mainWindow.setWindowTitle(
-            QCoreApplication.translate(f"{WINDOW_NAME}", f"{WINDOW_NAME}", None)
+            QCoreApplication.translate(WINDOW_NAME, WINDOW_NAME, None)
         )
 
     def createComponents(self, mainWindow):
@@ -238,9 +404,19 @@ class MIPDatasetMapperWindow(object):
         self.createTargetCDEsComponents(mainWindow)
         # Initialize components of the columns CDEs mapping group box (top right)
         self.createMappingComponents(mainWindow)
+        # Set the translated texts of the components
+        self.retranslateUi()
         # Create the status bar
         self.statusbar = QStatusBar(mainWindow)
 
+    def retranslateUi(self):
+        """Set the translated texts of the widgets in one table-driven pass."""
+        translate = QCoreApplication.translate
+        for widgetName, setterName, text in self._TEXTS:
+            getattr(getattr(self, widgetName), setterName)(
+                translate(WINDOW_NAME, text, None)
+            )
+
     def createToolBar(self, mainWindow):
         """Create the tool bar.
         
@@ -283,9 +459,7 @@ class MIPDatasetMapperWindow(object):
         mappingInitLabel = QLabel("(3). Mapping Initialization:")
         mappingInitLabel.setStyleSheet("QLabel { font-weight: bold; color: #222222;}")
         self.initMatchingMethod = QComboBox()
-        icon = pkg_resources.resource_filename(
-            "mip_dmp", os.path.join("qt5", "assets", "down_arrow.png")
-        )
+        icon = _asset("down_arrow.png")
         self.initMatchingMethod.setStyleSheet(
             f"QComboBox::down-arrow {{ image: url({icon}); height: 16px; width: 16px; }}"
         )
@@ -294,31 +468,19 @@ class MIPDatasetMapperWindow(object):
         self.toolBar.addWidget(mappingInitLabel)
         self.toolBar.addWidget(self.initMatchingMethod)
         self.mappingInitButton = QAction(
-            QIcon(
-                pkg_resources.resource_filename(
-                    "mip_dmp", os.path.join("qt5", "assets", "init_mapping.png")
-                )
-            ),
+            _icon("init_mapping.png"),
             "Initialize Mapping",
             mainWindow,
         )
         self.toolBar.addAction(self.mappingInitButton)
         self.matchingVizButton = QAction(
-            QIcon(
-                pkg_resources.resource_filename(
-                    "mip_dmp", os.path.join("qt5", "assets", "heatmap_matching.png")
-                )
-            ),
+            _icon("heatmap_matching.png"),
             "Visualize Column /CDE Match Distances",
             mainWindow,
         )
         self.toolBar.addAction(self.matchingVizButton)
         self.embeddingVizButton = QAction(
-            QIcon(
-                pkg_resources.resource_filename(
-                    "mip_dmp", os.path.join("qt5", "assets", "plot_embedding.png")
-                )
-            ),
+            _icon("plot_embedding.png"),
             "Visualize Word Embedding Matches in 3D (Enabled only for GloVe and Chars2Vec methods)",
             mainWindow,
         )
@@ -347,11 +509,7 @@ class MIPDatasetMapperWindow(object):
         actionsLabel.setStyleSheet("QLabel { font-weight: bold; color: #222222;}")
         self.toolBar.addWidget(actionsLabel)
         self.mapButton = QAction(
-            QIcon(
-                pkg_resources.resource_filename(
-                    "mip_dmp", os.path.join("qt5", "assets", "map.png")
-                )
-            ),
+            _icon("map.png"),
             "Map",
             mainWindow,
         )
@@ -372,33 +530,20 @@ class MIPDatasetMapperWindow(object):
         self.inputDatasetTableView = QTableView(self.inputDatasetGroupBox)
         self.inputDatasetTableView.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.inputDatasetTableView.setGeometry(QRect(10, 71, 341, 281))
+        _configure_table_view(self.inputDatasetTableView)
         # Set the form layout with button to load the dataset
         self.inputDatasetFormLayoutWidget = QWidget(self.inputDatasetGroupBox)
         self.inputDatasetFormLayoutWidget.setGeometry(QRect(10, 30, 341, 31))
         self.inputDatasetFormLayout = QFormLayout(self.inputDatasetFormLayoutWidget)
         self.inputDatasetFormLayout.setContentsMargins(0, 0, 0, 0)
         self.inputDatasetLoadButton = QAction(
-            QIcon(
-                pkg_resources.resource_filename(
-                    "mip_dmp", "qt5/assets/load_dataset.png"
-                )
-            ),
+            _icon("load_dataset.png"),
             "Load dataset",
             mainWindow,
         )
         self.inputDatasetLoadButton.setToolTip("Load source dataset (.csv format)")
         self.inputDatasetPathLabel = QLabel(self.inputDatasetFormLayoutWidget)
-        # Set text of the components
-        self.inputDatasetGroupBox.setTitle(
-            QCoreApplication.translate(f"{WINDOW_NAME}", "Source Dataset", None)
-        )
-        self.inputDatasetPathLabel.setText(
-            QCoreApplication.translate(
-                f"{WINDOW_NAME}",
-                "<Please load a source dataset file in .csv format...>",
-                None,
-            )
-        )
+        # Texts are set by retranslateUi via the _TEXTS table.
 
     def createTargetCDEsComponents(self, mainWindow):
         """Create the components of the target CDEs group box.
@@ -415,15 +560,14 @@ class MIPDatasetMapperWindow(object):
         self.targetCDEsTableView = QTableView(self.targetCDEsGroupBox)
         self.targetCDEsTableView.setGeometry(QRect(10, 70, 341, 101))
         self.targetCDEsTableView.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        _configure_table_view(self.targetCDEsTableView)
         # Set the form layout with button to load the CDEs file
         self.targetCDEsFormLayoutWidget = QWidget(self.targetCDEsGroupBox)
         self.targetCDEsFormLayoutWidget.setGeometry(QRect(10, 30, 341, 31))
         self.targetCDEsFormLayout = QFormLayout(self.targetCDEsFormLayoutWidget)
         self.targetCDEsFormLayout.setContentsMargins(0, 0, 0, 0)
         self.targetCDEsLoadButton = QAction(
-            QIcon(
-                pkg_resources.resource_filename("mip_dmp", "qt5/assets/load_cdes.png")
-            ),
+            _icon("load_cdes.png"),
             "Load CDE file",
             mainWindow,
         )
@@ -431,19 +575,7 @@ class MIPDatasetMapperWindow(object):
             "Load CDEs metadata schema file (.xlxs format)"
         )
         self.targetCDEsPathLabel = QLabel(self.targetCDEsFormLayoutWidget)
-        # Set text of the components
-        self.targetCDEsGroupBox.setTitle(
-            QCoreApplication.translate(
-                f"{WINDOW_NAME}", "Target CDEs Metadata Schema", None
-            )
-        )
-        self.targetCDEsPathLabel.setText(
-            QCoreApplication.translate(
-                f"{WINDOW_NAME}",
-                "<Please load a CDEs metadata schema file in .xlxs format>",
-                None,
-            )
-        )
+        # Texts are set by retranslateUi via the _TEXTS table.
 
     def createMappingComponents(self, mainWindow):
         """Create the components of the mapping group box.
@@ -462,11 +594,7 @@ class MIPDatasetMapperWindow(object):
         self.mappingFormLayout = QFormLayout(self.mappingFormLayoutWidget)
         self.mappingFormLayout.setContentsMargins(0, 0, 0, 0)
         self.mappingLoadButton = QAction(
-            QIcon(
-                pkg_resources.resource_filename(
-                    "mip_dmp", "qt5/assets/load_mapping.png"
-                )
-            ),
+            _icon("load_mapping.png"),
             "Load mapping file",
             mainWindow,
         )
@@ -485,6 +613,7 @@ class MIPDatasetMapperWindow(object):
             QHeaderView.Stretch
         )
         self.mappingTableView.horizontalHeader().setVisible(True)
+        _configure_table_view(self.mappingTableView)
         self.mappingTableViewAddDeleteRowWidget = QWidget(
             self.columnsCDEsMappingGroupBox
         )
@@ -493,32 +622,19 @@ class MIPDatasetMapperWindow(object):
         self.mappingTableViewAddRowButton.setToolTip(
             "Add a new row to the mapping table"
         )
-        self.mappingTableViewAddRowButton.setText(
-            QCoreApplication.translate(f"{WINDOW_NAME}", "Add", None)
-        )
         self.mappingTableViewDeleteRowButton = QPushButton(
             self.columnsCDEsMappingGroupBox
         )
         self.mappingTableViewDeleteRowButton.setToolTip(
             "Delete the selected row from the mapping table"
         )
-        self.mappingTableViewDeleteRowButton.setText(
-            QCoreApplication.translate(f"{WINDOW_NAME}", "Delete", None)
-        )
         # Create group box for entering a new entry to the mapping table
         self.mappingTableRowUpdateGroupBox = QGroupBox()
         # Create a form widget to edit row of mapping table
         self.createMappingTableRowViewComponents()
-        self.mappingTableRowUpdateGroupBox.setTitle(
-            QCoreApplication.translate(f"{WINDOW_NAME}", "Mapping Row Editor", None)
-        )
         # Create the save button
         self.mappingSaveButton = QAction(
-            QIcon(
-                pkg_resources.resource_filename(
-                    "mip_dmp", "qt5/assets/save_mapping.png"
-                )
-            ),
+            _icon("save_mapping.png"),
             "Save mapping file",
             mainWindow,
         )
@@ -526,26 +642,12 @@ class MIPDatasetMapperWindow(object):
             "Save Columns / CDEs mapping file (.json format)"
         )
         self.mappingCheckButton = QAction(
-            QIcon(
-                pkg_resources.resource_filename(
-                    "mip_dmp", "qt5/assets/check_mapping.png"
-                )
-            ),
+            _icon("check_mapping.png"),
             "Check Columns / CDEs mapping",
             mainWindow,
         )
         self.mappingCheckButton.setToolTip("Check Columns / CDEs mapping")
-        # Set text of the components
-        self.columnsCDEsMappingGroupBox.setTitle(
-            QCoreApplication.translate(f"{WINDOW_NAME}", "Columns / CDEs Mapping", None)
-        )
-        self.mappingFilePathLabel.setText(
-            QCoreApplication.translate(
-                f"{WINDOW_NAME}",
-                "<Please save/ load a Columns / CDEs mapping file in .json format...>",
-                None,
-            )
-        )
+        # Texts are set by retranslateUi via the _TEXTS table.
 
     def createMappingTableRowViewComponents(self):
         """Create the components of the mapping table row editor group box."""
@@ -555,9 +657,7 @@ class MIPDatasetMapperWindow(object):
         self.mappingRowIndex = QLabel(self.columnsCDEsMappingGroupBox)
         self.datasetColumn = QLabel(self.columnsCDEsMappingGroupBox)
         self.cdeCode = QComboBox(self.columnsCDEsMappingGroupBox)
-        icon = pkg_resources.resource_filename(
-            "mip_dmp", os.path.join("qt5", "assets", "down_arrow.png")
-        )
+        icon = _asset("down_arrow.png")
         self.cdeCode.setStyleSheet(
             f"QComboBox::down-arrow {{ image: url({icon}); height: 16px; width: 16px; }}"
         )
@@ -592,6 +692,8 @@ class MIPDatasetMapperWindow(object):
 
     def adjustWidgetsAndLayouts(self):
         """Add widgets to the layouts of the UI elements."""
+        # Bind the repeated enum lookup to a local once for the method body.
+        fieldRole = QFormLayout.FieldRole
         # Handle the splitters
         self.centralWidgetGridLayout.addWidget(self.centralWidgetSplitter, 0, 0, 1, 1)
         self.centralWidgetSplitter.addWidget(self.leftCentralWidgetSplitter)
@@ -602,7 +704,7 @@ class MIPDatasetMapperWindow(object):
             self.inputDatasetTableView, 0, 0, 1, 1
         )
         self.inputDatasetFormLayout.setWidget(
-            0, QFormLayout.FieldRole, self.inputDatasetPathLabel
+            0, fieldRole, self.inputDatasetPathLabel
         )
         self.inputDatasetGroupBoxLayout.addWidget(
             self.inputDatasetFormLayoutWidget, 1, 0, 1, 1
@@ -612,7 +714,7 @@ class MIPDatasetMapperWindow(object):
         self.targetCDEsGroupBox.setLayout(self.targetCDEsGroupBoxLayout)
         self.targetCDEsGroupBoxLayout.addWidget(self.targetCDEsTableView, 0, 0, 1, 1)
         self.targetCDEsFormLayout.setWidget(
-            0, QFormLayout.FieldRole, self.targetCDEsPathLabel
+            0, fieldRole, self.targetCDEsPathLabel
         )
         self.targetCDEsGroupBoxLayout.addWidget(
             self.targetCDEsFormLayoutWidget, 1, 0, 1, 1
@@ -621,7 +723,7 @@ class MIPDatasetMapperWindow(object):
         # Handle the widgets of the columns CDEs mapping group box (right)
         self.columnsCDEsMappingGroupBox.setLayout(self.columnsCDEsMappingGroupBoxLayout)
         self.mappingFormLayout.setWidget(
-            0, QFormLayout.FieldRole, self.mappingFilePathLabel
+            0, fieldRole, self.mappingFilePathLabel
         )
         self.columnsCDEsMappingGroupBoxLayout.addWidget(
             self.columnsCDEsMappingSplitter, 0, 0, 1, 1
@@ -731,9 +833,7 @@ class MIPDatasetMapperWindow(object):
                 # we propose the full list of CDEs ordered by fuzzy match
                 columnMatches = match_column_to_cdes(datasetColumn, self.targetCDEs)
             cdeCode = columnMatches[0]
-            cdeType = self.targetCDEs[self.targetCDEs["code"] == cdeCode][
-                "type"
-            ].unique()[0]
+            cdeType = self._cdeTypeByCode[cdeCode]
             if cdeType == "real" or cdeType == "integer":
                 transformType = "scale"
                 transform = "1.0"
@@ -758,12 +858,10 @@ class MIPDatasetMapperWindow(object):
             )
             QMessageBox.information(None, "Success", successMsg)
             self.statusbar.showMessage(successMsg)
-            self.statusbar.repaint()
         else:
             warnMsg = "No dataset column selected!"
             QMessageBox.warning(None, "Warning", warnMsg)
             self.statusbar.showMessage(warnMsg)
-            self.statusbar.repaint()
 
     def deleteMappingTableRow(self):
         """Delete the selected row from the mapping table."""
@@ -777,7 +875,6 @@ class MIPDatasetMapperWindow(object):
         successMsg = "Row {} deleted from the mapping table!".format(index.row())
         QMessageBox.information(None, "Success", successMsg)
         self.statusbar.showMessage(successMsg)
-        self.statusbar.repaint()
 
     def initializeMappingEditForm(self, index):
         """Initialize the mapping row editor form with the data of the selected row.
@@ -795,13 +892,22 @@ class MIPDatasetMapperWindow(object):
             columnMatches = self.matchedCdeCodes[rowData["dataset_column"]]["words"]
         else:
             columnMatches = self.targetCDEs["code"].unique().tolist()
-        self.cdeCode.clear()
-        self.cdeCode.addItems(columnMatches)
+        # Repopulate the combo box with signals blocked and updates
+        # disabled: clear/addItems/setCurrentIndex would otherwise fire
+        # currentIndexChanged (and a relayout) for every intermediate
+        # state, each re-entering updateMappingEditForm. The form fields
+        # are set explicitly below, so no signal is needed.
         ind = columnMatches.index(rowData["cde_code"])
-        self.cdeCode.setCurrentIndex(ind)
-        cdeType = self.targetCDEs[self.targetCDEs["code"] == columnMatches[ind]][
-            "type"
-        ].unique()[0]
+        self.cdeCode.blockSignals(True)
+        self.cdeCode.setUpdatesEnabled(False)
+        try:
+            self.cdeCode.clear()
+            self.cdeCode.addItems(columnMatches)
+            self.cdeCode.setCurrentIndex(ind)
+        finally:
+            self.cdeCode.setUpdatesEnabled(True)
+            self.cdeCode.blockSignals(False)
+        cdeType = self._cdeTypeByCode[columnMatches[ind]]
         self.cdeType.setText(cdeType)
         if cdeType == "real" or cdeType == "integer":
             self.transformType.setText("scale")
@@ -825,9 +931,7 @@ class MIPDatasetMapperWindow(object):
             columnMatches = self.matchedCdeCodes[rowData["dataset_column"]]["words"]
         else:
             columnMatches = self.targetCDEs["code"].unique().tolist()
-        cdeType = self.targetCDEs[self.targetCDEs["code"] == columnMatches[index]][
-            "type"
-        ].unique()[0]
+        cdeType = self._cdeTypeByCode[columnMatches[index]]
         self.cdeType.setText(str(cdeType))
         if cdeType == "real" or cdeType == "integer":
             if self.cdeCode.currentText() == rowData["cde_code"]:
@@ -861,110 +965,222 @@ class MIPDatasetMapperWindow(object):
             transformType,
             transform,
         ]
-        # Update the table
-        self.mappingTableView.model().layoutChanged.emit()
+        # Repaint only the edited row; layoutChanged is reserved for the
+        # add/delete paths where the row count actually changes.
+        self.mappingTableView.model().refreshRow(rowIndex)
 
     def loadInputDataset(self):
         """Load the input dataset."""
-        self.inputDatasetPath = QFileDialog.getOpenFileName(
+        path, _ = QFileDialog.getOpenFileName(
             None, "Select the input dataset", "", "CSV files (*.csv)"
         )
-        self.inputDatasetPathLabel.setText(self.inputDatasetPath[0])
-        if not os.path.exists(self.inputDatasetPath[0]):
-            self.inputDatasetPathLabel.setText(
-                QCoreApplication.translate(
-                    f"{WINDOW_NAME}", "<Please load a CSV file...>", None
+        # The dialog returns an empty path when cancelled.
+        if not path:
+            return
+        self.inputDatasetPath = path
+        self.inputDatasetPathLabel.setText(path)
+        if pacsv is not None:
+            # Parse the CSV file with the multi-threaded Arrow reader and
+            # hand the buffers over to pandas without an extra copy. Reading
+            # from a memory map lets the OS page the file in on demand
+            # instead of copying it into a userspace buffer first.
+            with pa.memory_map(path, "r") as source:
+                table = pacsv.read_csv(
+                    source,
+                    read_options=pacsv.ReadOptions(use_threads=True),
                 )
-            )
-            errMsg = (
-                f"The input dataset file {self.inputDatasetPath[0]} does not exist. "
-                "Please select a valid file!"
-            )
-            QMessageBox.warning(
-                None,
-                "Error",
-                errMsg,
-            )
-            self.updateStatusbar(errMsg)
-            self.disableMappingMapButtons()
-            self.disableMappingComponents()
+            # Capture the column names before to_pandas: self_destruct
+            # releases the table's buffers during the conversion.
+            self.inputDatasetColumns = list(table.column_names)
+            self.inputDataset = table.to_pandas(split_blocks=True, self_destruct=True)
         else:
-            self.inputDataset = pd.read_csv(self.inputDatasetPath[0])
+            self.inputDataset = pd.read_csv(path)
             self.inputDatasetColumns = self.inputDataset.columns.tolist()
-            self.inputDatasetPandasModel = PandasTableModel(self.inputDataset)
-            self.inputDatasetTableView.setModel(self.inputDatasetPandasModel)
-            self.updateStatusbar(f"Loaded input dataset {self.inputDatasetPath[0]}")
-            if hasattr(self, "targetCDEsPath") and os.path.exists(
-                self.targetCDEsPath[0]
-            ):
-                self.initMapping()
-                self.enableMappingButtons()
-                self.enableMappingInitItems()
-                self.enableMappingComponents()
-            else:
-                self.disableMappingMapButtons()
-                self.disableMappingInitItems()
-                self.disableMappingComponents()
+        _shrink_object_columns(self.inputDataset)
+        # The input dataset can have tens of thousands of rows; bind it
+        # through the lazily populated model so the view only works on
+        # the rows scrolled into sight.
+        self.inputDatasetPandasModel = LazyPandasTableModel(self.inputDataset)
+        self.inputDatasetTableView.setModel(self.inputDatasetPandasModel)
+        self.updateStatusbar(f"Loaded input dataset {path}")
+        self._datasetReady = True
+        if self._cdesReady:
+            self.initMapping()
+            self.enableMappingButtons()
+            self.enableMappingInitItems()
+            self.enableMappingComponents()
+        else:
+            self.disableMappingMapButtons()
+            self.disableMappingInitItems()
+            self.disableMappingComponents()
+
+    def _runInBackground(self, fn, onFinished, onError):
+        """Run a function on the global thread pool.
+
+        The GUI event loop keeps running while the function executes; the
+        result (or the error message) is delivered back to the given slots
+        on the GUI thread.
+
+        Parameters
+        ----------
+        fn : callable
+            Function executed on the thread pool.
+
+        onFinished : callable
+            Slot called with the function result.
+
+        onError : callable
+            Slot called with the error message if the function raises.
+        """
+        task = _BackgroundTask(fn)
+        task.signals.finished.connect(onFinished)
+        task.signals.error.connect(onError)
+        task.signals.finished.connect(
+            lambda _result, task=task: self._pendingTasks.remove(task)
+        )
+        task.signals.error.connect(
+            lambda _message, task=task: self._pendingTasks.remove(task)
+        )
+        self._pendingTasks.append(task)
+        QThreadPool.globalInstance().start(task)
 
     def loadCDEsFile(self):
         """Load the CDEs file."""
-        self.targetCDEsPath = QFileDialog.getOpenFileName(
+        path, _ = QFileDialog.getOpenFileName(
             None, "Select the CDEs file", "", "Excel files (*.xlsx)"
         )
-        self.targetCDEsPathLabel.setText(self.targetCDEsPath[0])
-        if not os.path.exists(self.targetCDEsPath[0]):
-            self.targetCDEsPathLabel.setText(
-                QCoreApplication.translate(
-                    f"{WINDOW_NAME}", "<Please load a CDEs file in .xlxs>", None
-                )
-            )
-            errMsg = (
-                f"The CDEs file {self.targetCDEsPath[0]} does not exist. "
-                "Please select a valid file!"
-            )
-            QMessageBox.warning(
-                None,
-                "Error",
-                errMsg,
-            )
-            self.updateStatusbar(errMsg)
+        # The dialog returns an empty path when cancelled.
+        if not path:
+            return
+        self.targetCDEsPath = path
+        self.targetCDEsPathLabel.setText(path)
+        # Parse the Excel file on the thread pool so the event loop (and
+        # the paint events) keep running during multi-second loads.
+        self.targetCDEsLoadButton.setEnabled(False)
+        self.updateStatusbar(f"Loading CDEs file {path}...")
+        self._runInBackground(
+            lambda: _read_excel(path),
+            self._onCDEsFileLoaded,
+            self._onCDEsFileError,
+        )
+
+    def _onCDEsFileLoaded(self, targetCDEs):
+        """Install the CDEs frame loaded by the background task.
+
+        Parameters
+        ----------
+        targetCDEs : pandas.DataFrame
+            The loaded CDEs metadata schema.
+        """
+        self.targetCDEsLoadButton.setEnabled(True)
+        self.targetCDEs = targetCDEs
+        _shrink_object_columns(self.targetCDEs)
+        # Index the CDE types by code once; the mapping edit form and the
+        # add-row path look the type up per interaction, and a dict lookup
+        # replaces a boolean-mask scan of the schema frame each time.
+        self._cdeTypeByCode = dict(
+            zip(self.targetCDEs["code"], self.targetCDEs["type"])
+        )
+        self.targetCDEsPandasModel = PandasTableModel(self.targetCDEs)
+        self.targetCDEsTableView.setModel(self.targetCDEsPandasModel)
+        successMsg = f"Loaded CDEs file {self.targetCDEsPath}"
+        self.updateStatusbar(successMsg)
+        self._cdesReady = True
+        if self._datasetReady:
+            self.initMapping()
+            self.enableMappingInitItems()
+            self.enableMappingButtons()
+            self.enableMappingComponents()
+        else:
             self.disableMappingMapButtons()
+            self.disableMappingInitItems()
             self.disableMappingComponents()
-        else:
-            self.targetCDEs = pd.read_excel(self.targetCDEsPath[0])
-            self.targetCDEsPandasModel = PandasTableModel(self.targetCDEs)
-            self.targetCDEsTableView.setModel(self.targetCDEsPandasModel)
-            successMsg = f"Loaded CDEs file {self.targetCDEsPath[0]}"
-            self.updateStatusbar(successMsg)
-            if hasattr(self, "inputDatasetPath") and os.path.exists(
-                self.inputDatasetPath[0]
-            ):
-                self.initMapping()
-                self.enableMappingInitItems()
-                self.enableMappingButtons()
-                self.enableMappingComponents()
-            else:
-                self.disableMappingMapButtons()
-                self.disableMappingInitItems()
-                self.disableMappingComponents()
+
+    def _onCDEsFileError(self, message):
+        """Report a CDEs file loading error raised by the background task.
+
+        Parameters
+        ----------
+        message : str
+            The error message.
+        """
+        self.targetCDEsLoadButton.setEnabled(True)
+        errMsg = f"The CDEs file {self.targetCDEsPath} could not be loaded: {message}"
+        QMessageBox.warning(
+            None,
+            "Error",
+            errMsg,
+        )
+        self.updateStatusbar(errMsg)
+        self.disableMappingMapButtons()
+        self.disableMappingComponents()
 
     def loadMapping(self):
         """Load the mapping file."""
-        self.mappingFilePath = QFileDialog.getOpenFileName(
-            None, "Select the mapping file", "", "JSON files (*.json)"
-        )
-        self.mappingFilePathLabel.setText(self.mappingFilePath[0])
-        if not os.path.exists(self.mappingFilePath[0]):
-            self.mappingFilePathLabel.setText(
-                QCoreApplication.translate(
-                    f"{WINDOW_NAME}",
-                    "<Please load an existing mapping json file...>",
-                    None,
-                )
+        path, _ = QFileDialog.getOpenFileName(
+            None, "Select the mapping file", "", MAPPING_FILE_FILTER
+        )
+        # The dialog returns an empty path when cancelled.
+        if not path:
+            return
+        self.mappingFilePath = path
+        self.mappingFilePathLabel.setText(path)
+        try:
+            # Load the mapping table file in Feather or JSON format
+            if path.endswith(".feather"):
+                self.columnsCDEsMappingData = feather.read_feather(path)
+                if not set(MAPPING_TABLE_COLUMNS).issubset(
+                    self.columnsCDEsMappingData.columns
+                ):
+                    raise ValueError(
+                        "The mapping file is not in the correct format. "
+                        "The mapping file must contain the following "
+                        f"columns: {MAPPING_TABLE_COLUMNS}."
+                    )
+            else:
+                self.columnsCDEsMappingData = load_mapping_json(path)
+            print(f"Mapping loaded from {path}")
+            # Create a pandas model for the mapping table
+            self.columnsCDEsMappingPandasModel = PandasTableModel(
+                self.columnsCDEsMappingData
+            )
+            # Set the model of the table view to the pandas model
+            self.mappingTableView.setModel(self.columnsCDEsMappingPandasModel)
+            self.mappingTableView.setSelectionBehavior(
+                self.mappingTableView.SelectRows
+            )
+            self.mappingTableView.setSelectionMode(
+                self.mappingTableView.SingleSelection
+            )
+            self.mappingTableView.setEditTriggers(
+                self.mappingTableView.NoEditTriggers
+            )  # disable editing
+            # Handle the mapping table view row selection changed signal
+            self.mappingTableView.selectionModel().currentRowChanged.connect(
+                self.initializeMappingEditForm
             )
+            # Select the first row of the mapping table view at the beginning
+            indexRow = 0
+            self.mappingTableView.selectRow(indexRow)
+            # Handle the combox box current index changed signal for the CDE code column
+            self.cdeCode.currentIndexChanged.connect(self.updateMappingEditForm)
+            # Display a success message
+            successMsg = (
+                f"Loaded mapping file {path}. \n"
+                "Please Check the mapping, Save it and Click on the "
+                "Map button to map the input dataset."
+            )
+            QMessageBox.information(
+                None,
+                "Success",
+                successMsg,
+            )
+            self.updateStatusbar(successMsg)
+        except ValueError as e:
+            # Display an error message
             errMsg = (
-                f"The mapping file {self.mappingFilePath[0]} does not exist. "
-                "Please select a valid file!"
+                f"The mapping file {path} is not valid: {repr(e)} \n"
+                "Please select a valid file! "
             )
             QMessageBox.warning(
                 None,
@@ -972,72 +1188,24 @@ class MIPDatasetMapperWindow(object):
                 errMsg,
             )
             self.updateStatusbar(errMsg)
-            self.disableMappingMapButtons()
-        else:
-            try:
-                # Load the mapping table file in JSON format
-                self.columnsCDEsMappingData = load_mapping_json(self.mappingFilePath[0])
-                print(f"Mapping loaded from {self.mappingFilePath[0]}")
-                # Create a pandas model for the mapping table
-                self.columnsCDEsMappingPandasModel = PandasTableModel(
-                    self.columnsCDEsMappingData
-                )
-                # Set the model of the table view to the pandas model
-                self.mappingTableView.setModel(self.columnsCDEsMappingPandasModel)
-                self.mappingTableView.setSelectionBehavior(
-                    self.mappingTableView.SelectRows
-                )
-                self.mappingTableView.setSelectionMode(
-                    self.mappingTableView.SingleSelection
-                )
-                self.mappingTableView.setEditTriggers(
-                    self.mappingTableView.NoEditTriggers
-                )  # disable editing
-                # Handle the mapping table view row selection changed signal
-                self.mappingTableView.selectionModel().currentRowChanged.connect(
-                    self.initializeMappingEditForm
-                )
-                # Select the first row of the mapping table view at the beginning
-                indexRow = 0
-                self.mappingTableView.selectRow(indexRow)
-                # Handle the combox box current index changed signal for the CDE code column
-                self.cdeCode.currentIndexChanged.connect(self.updateMappingEditForm)
-                # Display a success message
-                successMsg = (
-                    f"Loaded mapping file {self.mappingFilePath[0]}. \n"
-                    "Please Check the mapping, Save it and Click on the "
-                    "Map button to map the input dataset."
-                )
-                QMessageBox.information(
-                    None,
-                    "Success",
-                    successMsg,
-                )
-                self.updateStatusbar(successMsg)
-            except ValueError as e:
-                # Display an error message
-                errMsg = (
-                    f"The mapping file {self.mappingFilePath[0]} is not valid: {repr(e)} \n"
-                    "Please select a valid file! "
-                )
-                QMessageBox.warning(
-                    None,
-                    "Error",
-                    errMsg,
-                )
-                self.updateStatusbar(errMsg)
-            self.disableMappingMapButtons()
-            self.enableMappingButtons()
+        self.disableMappingMapButtons()
+        self.enableMappingButtons()
 
     def saveMapping(self):
         """Save the mapping file."""
-        self.mappingFilePath = QFileDialog.getSaveFileName(
-            None, "Select the mapping file", "", "JSON files (*.json)"
+        filePath, _ = QFileDialog.getSaveFileName(
+            None, "Select the mapping file", "", MAPPING_FILE_FILTER
         )
-        path = Path(self.mappingFilePath[0])
-        if path.suffix != ".json":
+        # The dialog returns an empty path when cancelled.
+        if not filePath:
+            return
+        self.mappingFilePath = filePath
+        path = Path(filePath)
+        validSuffixes = (".json", ".feather") if feather is not None else (".json",)
+        if path.suffix not in validSuffixes:
             errMsg = (
-                f"The mapping file {self.mappingFilePath[0]} does not have a .json extension. "
+                f"The mapping file {filePath} does not have a "
+                f"{' or '.join(validSuffixes)} extension. "
                 "Please select a valid file!"
             )
             QMessageBox.warning(
@@ -1048,13 +1216,25 @@ class MIPDatasetMapperWindow(object):
             return
         # Create the directories if they do not exist
         os.makedirs(path.parent, exist_ok=True)
-        # Convert the mapping data frame to a json file
-        self.columnsCDEsMappingData.to_json(
-            self.mappingFilePath[0], orient="records", indent=4
-        )
-        print(f"Mapping saved to {self.mappingFilePath[0]}")
-        self.mappingFilePathLabel.setText(self.mappingFilePath[0])
-        successMsg = f"Mapping saved to {self.mappingFilePath[0]}!"
+        if path.suffix == ".feather":
+            # Write the mapping data frame in native columnar form, which
+            # round-trips the dtypes and reloads without re-parsing.
+            feather.write_feather(
+                self.columnsCDEsMappingData, path, compression="zstd"
+            )
+        # Convert the mapping data frame to a json file. orjson serializes
+        # the records in one C-level pass and writes UTF-8 bytes directly,
+        # avoiding the slow indented pandas to_json path.
+        elif orjson is not None:
+            records = self.columnsCDEsMappingData.to_dict(orient="records")
+            path.write_bytes(orjson.dumps(records, option=orjson.OPT_INDENT_2))
+        else:
+            self.columnsCDEsMappingData.to_json(
+                filePath, orient="records", indent=4
+            )
+        print(f"Mapping saved to {filePath}")
+        self.mappingFilePathLabel.setText(filePath)
+        successMsg = f"Mapping saved to {filePath}!"
         QMessageBox.information(
             None,
             "Success",
@@ -1243,20 +1423,31 @@ class MIPDatasetMapperWindow(object):
         self.columnsCDEsMappingPandasModel = PandasTableModel(
             self.columnsCDEsMappingData
         )
-        # Set the model of the table view to the pandas model
-        self.mappingTableView.setModel(self.columnsCDEsMappingPandasModel)
-        self.mappingTableView.setSelectionBehavior(self.mappingTableView.SelectRows)
-        self.mappingTableView.setSelectionMode(self.mappingTableView.SingleSelection)
-        self.mappingTableView.setEditTriggers(
-            self.mappingTableView.NoEditTriggers
-        )  # disable editing
-        # Handle the mapping table view row selection changed signal
-        self.mappingTableView.selectionModel().currentRowChanged.connect(
-            self.initializeMappingEditForm
-        )
-        # Select the first row of the mapping table view at the beginning
-        indexRow = 0
-        self.mappingTableView.selectRow(indexRow)
+        # Rebind the model and reconfigure the view with updates
+        # suspended so the sequence triggers a single repaint at the end
+        # instead of one per call.
+        self.mappingTableView.setUpdatesEnabled(False)
+        try:
+            # Set the model of the table view to the pandas model
+            self.mappingTableView.setModel(self.columnsCDEsMappingPandasModel)
+            self.mappingTableView.setSelectionBehavior(
+                self.mappingTableView.SelectRows
+            )
+            self.mappingTableView.setSelectionMode(
+                self.mappingTableView.SingleSelection
+            )
+            self.mappingTableView.setEditTriggers(
+                self.mappingTableView.NoEditTriggers
+            )  # disable editing
+            # Handle the mapping table view row selection changed signal
+            self.mappingTableView.selectionModel().currentRowChanged.connect(
+                self.initializeMappingEditForm
+            )
+            # Select the first row of the mapping table view at the beginning
+            indexRow = 0
+            self.mappingTableView.selectRow(indexRow)
+        finally:
+            self.mappingTableView.setUpdatesEnabled(True)
         # Handle the combox box current index changed signal for the CDE code column
         self.cdeCode.currentIndexChanged.connect(self.updateMappingEditForm)
         # Show status message
@@ -1268,41 +1459,90 @@ class MIPDatasetMapperWindow(object):
     def mappingMatch(self):
         """Initialize the column/CDEs mapping based on fuzzy word matching and character embedding methods."""
         matchingMethod = self.initMatchingMethod.currentText()
+        # The match result only depends on the loaded dataset / schema
+        # files and the method; skip the expensive matching pass when
+        # none of them changed since the last run.
+        matchKey = (
+            self.inputDatasetPath,
+            os.path.getmtime(self.inputDatasetPath),
+            self.targetCDEsPath,
+            os.path.getmtime(self.targetCDEsPath),
+            matchingMethod,
+        )
+        if matchKey == self._lastMatchKey:
+            self.updateStatusbar(
+                "The mapping is already initialized with the "
+                f"{matchingMethod} method for these files."
+            )
+            return
+        self._lastMatchKey = matchKey
         infoMsg = (
             f"The mapping is being initialize using the {matchingMethod} method."
             "Please wait until the process is finished."
         )
         self.updateStatusbar(infoMsg)
-        # Create a first mapping table based on fuzzy matching
+        # Run the matching on the thread pool: the O(columns x CDEs) fuzzy /
+        # embedding work must not freeze the event loop.
+        self.mappingInitButton.setEnabled(False)
+        self.initMatchingMethod.setEnabled(False)
+        self._runInBackground(
+            lambda: match_columns_to_cdes(
+                dataset=self.inputDataset,
+                schema=self.targetCDEs,
+                nb_kept_matches=NB_KEPT_MATCHES,
+                matching_method=matchingMethod,
+            ),
+            self._onMatchingFinished,
+            self._onMatchingError,
+        )
+
+    def _onMatchingFinished(self, result):
+        """Install the mapping table produced by the background matching task.
+
+        Parameters
+        ----------
+        result : tuple
+            The tuple returned by
+            :func:`mip_dmp.process.matching.match_columns_to_cdes`.
+        """
+        matchingMethod = self.initMatchingMethod.currentText()
         (
             self.columnsCDEsMappingData,
             self.matchedCdeCodes,
             self.inputDatasetColumnEmbeddings,
             self.targetCDEsEmbeddings,
-        ) = match_columns_to_cdes(
-            dataset=self.inputDataset,
-            schema=self.targetCDEs,
-            nb_kept_matches=NB_KEPT_MATCHES,
-            matching_method=matchingMethod,
-        )
+        ) = result
+        self.mappingInitButton.setEnabled(True)
+        self.initMatchingMethod.setEnabled(True)
         # Create a pandas model for the mapping table
         self.columnsCDEsMappingPandasModel = PandasTableModel(
             self.columnsCDEsMappingData
         )
-        # Set the model of the table view to the pandas model
-        self.mappingTableView.setModel(self.columnsCDEsMappingPandasModel)
-        self.mappingTableView.setSelectionBehavior(self.mappingTableView.SelectRows)
-        self.mappingTableView.setSelectionMode(self.mappingTableView.SingleSelection)
-        self.mappingTableView.setEditTriggers(
-            self.mappingTableView.NoEditTriggers
-        )  # disable editing
-        # Handle the mapping table view row selection changed signal
-        self.mappingTableView.selectionModel().currentRowChanged.connect(
-            self.initializeMappingEditForm
-        )
-        # Select the first row of the mapping table view at the beginning
-        indexRow = 0
-        self.mappingTableView.selectRow(indexRow)
+        # Rebind the model and reconfigure the view with updates
+        # suspended so the sequence triggers a single repaint at the end
+        # instead of one per call.
+        self.mappingTableView.setUpdatesEnabled(False)
+        try:
+            # Set the model of the table view to the pandas model
+            self.mappingTableView.setModel(self.columnsCDEsMappingPandasModel)
+            self.mappingTableView.setSelectionBehavior(
+                self.mappingTableView.SelectRows
+            )
+            self.mappingTableView.setSelectionMode(
+                self.mappingTableView.SingleSelection
+            )
+            self.mappingTableView.setEditTriggers(
+                self.mappingTableView.NoEditTriggers
+            )  # disable editing
+            # Handle the mapping table view row selection changed signal
+            self.mappingTableView.selectionModel().currentRowChanged.connect(
+                self.initializeMappingEditForm
+            )
+            # Select the first row of the mapping table view at the beginning
+            indexRow = 0
+            self.mappingTableView.selectRow(indexRow)
+        finally:
+            self.mappingTableView.setUpdatesEnabled(True)
         # Handle the combox box current index changed signal for the CDE code column
         self.cdeCode.currentIndexChanged.connect(self.updateMappingEditForm)
         # Show status message
@@ -1315,12 +1555,32 @@ class MIPDatasetMapperWindow(object):
             self.embeddingVizButton.setEnabled(False)
         self.matchingVizButton.setEnabled(True)
 
+    def _onMatchingError(self, message):
+        """Report a mapping initialization error raised by the background task.
+
+        Parameters
+        ----------
+        message : str
+            The error message.
+        """
+        self.mappingInitButton.setEnabled(True)
+        self.initMatchingMethod.setEnabled(True)
+        # Allow an immediate retry with the same inputs.
+        self._lastMatchKey = None
+        errMsg = f"The mapping initialization failed: {message}"
+        QMessageBox.warning(
+            None,
+            "Error",
+            errMsg,
+        )
+        self.updateStatusbar(errMsg)
+
     def selectOutputFilename(self):
         """Select the output filename."""
-        self.outputFilename = QFileDialog.getSaveFileName(
+        outputFilename, _ = QFileDialog.getSaveFileName(
             None, "Select the output filename", "", "CSV files (*.csv)"
         )
-        if self.outputFilename[0] == "":
+        if outputFilename == "":
             errMsg = "Please select a valid output filename."
             QMessageBox.warning(
                 None,
@@ -1329,22 +1589,27 @@ class MIPDatasetMapperWindow(object):
             )
             self.updateStatusbar(errMsg)
             return False
-        if not self.outputFilename[0].endswith(".csv"):
-            self.outputFilename = self.outputFilename[0] + ".csv"
+        if not outputFilename.endswith(".csv"):
+            outputFilename += ".csv"
             successMsg = (
-                "The output filename has been updated to: " + self.outputFilename + "."
+                "The output filename has been updated to: " + outputFilename + "."
             )
             QMessageBox.information(
                 None,
+                "Success",
                 successMsg,
             )
             self.updateStatusbar(successMsg)
+        self.outputFilename = outputFilename
         return True
 
     def updateStatusbar(self, message):
-        """Update the statusbar with the given message."""
+        """Update the statusbar with the given message.
+
+        The repaint is left to the event loop; forcing a synchronous
+        repaint here blocked the GUI thread until compositing finished.
+        """
         self.statusbar.showMessage(message)
-        self.statusbar.repaint()
 
     def map(self):
         """Map the input dataset to the target CDEs."""
@@ -1352,8 +1617,10 @@ class MIPDatasetMapperWindow(object):
         # Exit function if the output filename is not properly set
         if not select:
             return
-        # Check if the input dataset and the mapping file are loaded
-        if not os.path.exists(self.inputDatasetPathLabel.text()):
+        # Check if the input dataset and the mapping file are loaded. The
+        # in-memory state is authoritative; no need to stat the filesystem
+        # or read the path labels back from Qt.
+        if not self._datasetReady:
             warn_msg = "Please load the input dataset!"
             QMessageBox.warning(
                 None,
@@ -1363,7 +1630,7 @@ class MIPDatasetMapperWindow(object):
             )
             self.updateStatusbar(warn_msg)
             return
-        if not os.path.exists(self.mappingFilePathLabel.text()):
+        if getattr(self, "mappingFilePath", None) is None:
             warn_msg = "Please save the mapping file of load an existing one!"
             QMessageBox.warning(
                 None,
@@ -1373,28 +1640,63 @@ class MIPDatasetMapperWindow(object):
             )
             self.updateStatusbar(warn_msg)
             return
+        # Make sure the output location is writable before spending the
+        # CPU time on the mapping itself.
+        outputDir = Path(self.outputFilename).parent
+        try:
+            outputDir.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            writable = False
+        else:
+            writable = os.access(outputDir, os.W_OK)
+        if not writable:
+            errMsg = f"The output directory {outputDir} is not writable!"
+            QMessageBox.warning(
+                None,
+                "Error",
+                errMsg,
+            )
+            self.updateStatusbar(errMsg)
+            return
         # Proceed with the mapping
         self.mapButton.setEnabled(False)
         self.updateStatusbar("Mapping in progress...")
-        # Load the input dataset
-        input_dataset = pd.read_csv(self.inputDatasetPathLabel.text())
-        # Load the mapping file
-        with open(self.mappingFilePathLabel.text(), "r") as f:
-            mapping = json.load(f)
-        # Map the input dataset to the target CDEs
-        output_dataset = map_dataset(
-            input_dataset, mapping, self.targetCDEs["code"].tolist()
-        )
-        # Save the output dataset
-        output_dataset.to_csv(
-            self.outputFilename[0],
-            index=False,
-        )
-        # Show a message box to inform the user that the mapping has
-        # been done successfully
+        # Reuse the dataset already parsed by loadInputDataset and the
+        # in-memory mapping table instead of re-reading both files on
+        # every click (the CSV parse dominates the cost of a Map run).
+        input_dataset = self.inputDataset
+        mapping = self.columnsCDEsMappingData.to_dict(orient="records")
+        cde_codes = self.targetCDEs["code"].tolist()
+        output_filename = self.outputFilename
+
+        def _mapAndWrite():
+            """Map the dataset and write the output CSV off the GUI thread."""
+            output_dataset = map_dataset(input_dataset, mapping, cde_codes)
+            # Formatting and flushing the rows in batches caps the peak
+            # size of the CSV formatting buffer instead of materializing
+            # the whole file in memory before writing.
+            output_dataset.to_csv(
+                output_filename,
+                index=False,
+                chunksize=64_000,
+            )
+            return output_filename
+
+        # Run the mapping and the CSV write on the thread pool so the UI
+        # stays responsive; the pandas C paths release the GIL.
+        self._runInBackground(_mapAndWrite, self._onMapFinished, self._onMapError)
+
+    def _onMapFinished(self, outputFilename):
+        """Report the mapping success in the GUI thread.
+
+        Parameters
+        ----------
+        outputFilename : str
+            Path of the written output dataset.
+        """
         successMsg = (
             "The mapping has been done successfully and "
-            "the output dataset has been saved to: " + self.outputFilename[0] + "."
+            "the output dataset has been saved to: " + outputFilename + "."
         )
         QMessageBox.information(
             None,
@@ -1404,3 +1706,20 @@ class MIPDatasetMapperWindow(object):
         )
         self.updateStatusbar(successMsg)
         self.mapButton.setEnabled(True)
+
+    def _onMapError(self, message):
+        """Report a mapping failure in the GUI thread.
+
+        Parameters
+        ----------
+        message : str
+            Error message raised by the background mapping task.
+        """
+        errMsg = f"The mapping failed: {message}"
+        QMessageBox.critical(
+            None,
+            "Error",
+            errMsg,
+        )
+        self.updateStatusbar(errMsg)
+        self.mapButton.setEnabled(True)
@@ -15,10 +15,9 @@
 """Module that defines the class dedicated to the widget that supports the visualization of the initial automated mapping matches via embedding."""
 
 # External imports
-import os
 import numpy as np
 import matplotlib.pyplot as plt
-import pkg_resources
+from importlib import resources
 from matplotlib.backends.backend_qt5agg import (
     FigureCanvasQTAgg as FigureCanvas,
     NavigationToolbar2QT as NavigationToolbar,
@@ -86,14 +85,14 @@ class WordEmbeddingVisualizationWidget(QWidget):
         # Adjust the window size
         # self.resize(1280, 720)
         # Set the window Qt Style Sheet
-        styleSheetFile = pkg_resources.resource_filename(
-            "mip_dmp", os.path.join("qt5", "assets", "stylesheet.qss")
+        self.setStyleSheet(
+            (
+                resources.files("mip_dmp") / "qt5" / "assets" / "stylesheet.qss"
+            ).read_text()
         )
-        with open(styleSheetFile, "r") as fh:
-            self.setStyleSheet(fh.read())
         # Set the window title
         self.setWindowTitle(
-            QCoreApplication.translate(f"{WINDOW_NAME}", f"{WINDOW_NAME}", None)
+            QCoreApplication.translate(WINDOW_NAME, WINDOW_NAME, None)
         )
 
     def set_word_list(self, wordList):
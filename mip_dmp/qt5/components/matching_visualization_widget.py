@@ -15,9 +15,8 @@
 """Module that defines the class for the widget that supports the visualization of the distances obtained by the automated mapping matches for the n most similar CDE codes."""
 
 # External imports
-import os
 import matplotlib.pyplot as plt
-import pkg_resources
+from importlib import resources
 from matplotlib.backends.backend_qt5agg import (
     FigureCanvasQTAgg as FigureCanvas,
     NavigationToolbar2QT as NavigationToolbar,
@@ -116,14 +115,14 @@ class MatchingVisualizationWidget(QWidget):
         # Adjust the window size
         # self.resize(1280, 720)
         # Set the window Qt Style Sheet
-        styleSheetFile = pkg_resources.resource_filename(
-            "mip_dmp", os.path.join("qt5", "assets", "stylesheet.qss")
+        self.setStyleSheet(
+            (
+                resources.files("mip_dmp") / "qt5" / "assets" / "stylesheet.qss"
+            ).read_text()
         )
-        with open(styleSheetFile, "r") as fh:
-            self.setStyleSheet(fh.read())
         # Set the window title
         self.setWindowTitle(
-            QCoreApplication.translate(f"{WINDOW_NAME}", f"{WINDOW_NAME}", None)
+            QCoreApplication.translate(WINDOW_NAME, WINDOW_NAME, None)
         )
 
     def set_wordcombobox_items(self, wordList):
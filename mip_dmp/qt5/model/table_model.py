@@ -22,6 +22,8 @@ from PySide2.QtWidgets import QItemDelegate, QLineEdit, QComboBox
 class PandasTableModel(QtCore.QAbstractTableModel):
     """Qt Table Model for Pandas DataFrames."""
 
+    __slots__ = ["_data", "_values", "_columns", "_index"]
+
     def __init__(self, data):
         """Initialize the table model.
 
@@ -32,16 +34,26 @@ class PandasTableModel(QtCore.QAbstractTableModel):
         """
         super(PandasTableModel, self).__init__()
         self._data = data
+        self._refreshCache()
+        # The frame is edited in place by the window (row added, deleted or
+        # updated) which then emits layoutChanged; re-snapshot the arrays.
+        self.layoutChanged.connect(self._refreshCache)
 
-    def setData(self, data):
-        self._data = data
-        self.layoutChanged.emit()
+    def _refreshCache(self):
+        """Snapshot the frame as raw arrays served by data()/headerData().
+
+        Qt interrogates the model for every visible cell on each repaint;
+        indexing a plain ndarray avoids going through the pandas iloc
+        machinery per cell.
+        """
+        self._values = self._data.to_numpy(copy=False)
+        self._columns = self._data.columns.to_numpy()
+        self._index = self._data.index.to_numpy()
 
     def data(self, index, role):
         """Return the data for the given index and role."""
         if role == Qt.DisplayRole:
-            value = self._data.iloc[index.row(), index.column()]
-            return str(value)
+            return str(self._values[index.row(), index.column()])
 
     def rowCount(self, index):
         """Return the number of rows in the table."""
@@ -64,21 +76,88 @@ class PandasTableModel(QtCore.QAbstractTableModel):
         # section is the index of the column/row.
         if role == Qt.DisplayRole:
             if orientation == Qt.Horizontal:
-                return str(self._data.columns[section])
+                return str(self._columns[section])
 
             if orientation == Qt.Vertical:
-                return str(self._data.index[section])
+                return str(self._index[section])
+
+    def refreshRow(self, row):
+        """Notify the views that one row was edited in place.
+
+        Emitting dataChanged restricted to the display role of the edited
+        row keeps the repaint proportional to the changed cells, instead of
+        the full role-times-cells re-query triggered by layoutChanged.
+
+        Parameters
+        ----------
+        row : int
+            Index of the edited row.
+        """
+        self._refreshCache()
+        self.dataChanged.emit(
+            self.index(row, 0),
+            self.index(row, self._data.shape[1] - 1),
+            [Qt.DisplayRole],
+        )
 
     def setData(self, index, value, role):
         """Set the data for the given index and role."""
         if role == Qt.EditRole:
             # Set the value into the frame.
             self._data.iloc[index.row(), index.column()] = value
+            self._refreshCache()
             self.dataChanged.emit(index, index, [role])
             return True
         return False
 
 
+class LazyPandasTableModel(PandasTableModel):
+    """Qt Table Model that exposes the rows of a Pandas DataFrame in batches.
+
+    Only the first batch of rows is populated initially; Qt calls
+    `fetchMore` as the view is scrolled, so painting and layout work stay
+    proportional to the rows actually shown instead of the whole dataset.
+    """
+
+    BATCH_SIZE = 500
+
+    __slots__ = ["_loadedRowCount"]
+
+    def __init__(self, data):
+        """Initialize the table model.
+
+        Parameters
+        ----------
+        data : pandas.DataFrame
+            Data to be displayed in the table.
+        """
+        super(LazyPandasTableModel, self).__init__(data)
+        self._loadedRowCount = min(self.BATCH_SIZE, data.shape[0])
+
+    def rowCount(self, index):
+        """Return the number of rows loaded so far."""
+        return self._loadedRowCount
+
+    def canFetchMore(self, index):
+        """Return True if not all rows of the frame are loaded yet."""
+        return self._loadedRowCount < self._data.shape[0]
+
+    def fetchMore(self, index):
+        """Load the next batch of rows into the view."""
+        itemsToFetch = min(
+            self._data.shape[0] - self._loadedRowCount, self.BATCH_SIZE
+        )
+        if itemsToFetch <= 0:
+            return
+        self.beginInsertRows(
+            QtCore.QModelIndex(),
+            self._loadedRowCount,
+            self._loadedRowCount + itemsToFetch - 1,
+        )
+        self._loadedRowCount += itemsToFetch
+        self.endInsertRows()
+
+
 class QComboBoxDelegate(QItemDelegate):
     """Class to define a custom item delegate with QComboBox editor."""
 
@@ -15,9 +15,8 @@
 """Standalone script which starts the MIP Dataset Mapper UI application."""
 
 import sys
-from os import path as op
+from importlib import resources
 from os import environ as env
-from pkg_resources import resource_filename
 from PySide2 import QtGui
 from PySide2.QtWidgets import QApplication, QMainWindow
 
@@ -47,7 +46,7 @@ class MIPDatasetMapperUI(QMainWindow):
     def setIcon(self):
         """Set the application icon."""
         appIcon = QtGui.QIcon(
-            resource_filename("mip_dmp", op.join("qt5", "assets", "mip_dmp_icon.png"))
+            str(resources.files("mip_dmp") / "qt5" / "assets" / "mip_dmp_icon.png")
         )
         self.setWindowIcon(appIcon)
 
@@ -15,15 +15,29 @@
 """Module for input/output operations with files involved in the MIP Dataset Mapper."""
 
 import json
+import os
+from functools import lru_cache
 from pathlib import Path
 import pandas as pd
 import gensim.downloader as api
 import chars2vec
 
+try:
+    import orjson
+except ImportError:  # Fall back to the standard library JSON parser.
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # Fall back to the pandas CSV writer.
+    pa = None
+    pacsv = None
+
 from mip_dmp.process.mapping import MAPPING_TABLE_COLUMNS
 
 
-def load_csv(csc_file: str):
+def load_csv(csv_file: str, usecols=None):
     """Load content of a CSV file.
 
     Parameters
@@ -31,16 +45,51 @@ def load_csv(csc_file: str):
     csv_file : str
         Path to CSV file.
 
+    usecols : list, callable or None, optional
+        Columns to load, passed to `pandas.read_csv`. Restricting the
+        columns skips parsing and storing the unused ones, by default None
+        (load all columns).
+
     Returns
     -------
     data : pd.DataFrame
         Dataframe loaded from CSV file.
     """
-    data = pd.read_csv(csc_file)
+    # The pyarrow engine parses the file with multiple threads. It does
+    # not accept a callable usecols, and pandas raises ImportError when
+    # pyarrow is not installed; both cases fall back to the default engine.
+    if not callable(usecols):
+        try:
+            return pd.read_csv(csv_file, usecols=usecols, engine="pyarrow")
+        except ImportError:
+            pass
+    data = pd.read_csv(csv_file, usecols=usecols)
     return data
 
 
-def load_excel(excel_file: str):
+def save_csv(data, csv_file):
+    """Write a dataframe to a CSV file.
+
+    The multithreaded Arrow writer is used when pyarrow is installed; the
+    pandas writer remains the fallback.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        Dataframe to be written, without its index.
+
+    csv_file : str
+        Path to CSV file.
+    """
+    if pacsv is not None:
+        pacsv.write_csv(
+            pa.Table.from_pandas(data, preserve_index=False), str(csv_file)
+        )
+        return
+    data.to_csv(csv_file, index=False)
+
+
+def load_excel(excel_file: str, usecols=None):
     """Load content of an Excel file.
 
     Parameters
@@ -48,33 +97,66 @@ def load_excel(excel_file: str):
     excel_file : str
         Path to Excel file.
 
+    usecols : list or None, optional
+        Columns to load, passed to `pandas.read_excel`, by default None
+        (load all columns).
+
     Returns
     -------
     data : pd.DataFrame
         Dataframe loaded from Excel file.
     """
-    data = pd.read_excel(excel_file)
+    data = pd.read_excel(excel_file, usecols=usecols)
     return data
 
 
-def load_json(json_file: str):
-    """Load content of a JSON file.
+@lru_cache(maxsize=8)
+def _load_json_cached(json_file: str, mtime: float):
+    """Parse a JSON file, memoized on the path and modification time.
 
     Parameters
     ----------
     json_file : str
         Path to JSON file.
 
+    mtime : float
+        Modification time of the file, used as cache key so the cache is
+        invalidated whenever the file changes on disk.
+
     Returns
     -------
     data : dict
         Dictionary loaded from JSON file.
     """
+    if orjson is not None:
+        # orjson parses the whole byte buffer in one C-level pass,
+        # noticeably faster than the standard library on large files.
+        with open(json_file, "rb") as f:
+            return orjson.loads(f.read())
     with open(json_file) as f:
         data = json.load(f)
         return data
 
 
+def load_json(json_file: str):
+    """Load content of a JSON file.
+
+    Repeated loads of an unchanged file are served from an in-memory cache
+    keyed on the file modification time.
+
+    Parameters
+    ----------
+    json_file : str
+        Path to JSON file.
+
+    Returns
+    -------
+    data : dict
+        Dictionary loaded from JSON file.
+    """
+    return _load_json_cached(str(json_file), os.path.getmtime(json_file))
+
+
 def load_mapping_json(json_file: str):
     """Load content of a saved mapping JSON file.
 
@@ -88,11 +170,17 @@ def load_mapping_json(json_file: str):
     data : dict
         Dictionary loaded from JSON file.
     """
-    data = pd.read_json(json_file, orient="records")
+    if orjson is not None:
+        # Decode the records with orjson in one C-level pass and build the
+        # frame directly, skipping the slower pandas JSON reader.
+        with open(json_file, "rb") as f:
+            data = pd.DataFrame(orjson.loads(f.read()))
+    else:
+        data = pd.read_json(json_file, orient="records")
     # Check if the mapping file is in the correct format
     # i.e. if it contains the required columns listed in
     # MAPPING_TABLE_COLUMNS
-    if not all([col in data.columns for col in MAPPING_TABLE_COLUMNS]):
+    if not set(MAPPING_TABLE_COLUMNS).issubset(data.columns):
         raise ValueError(
             "The mapping file is not in the correct format. "
             "The mapping file must contain the following columns: "
@@ -128,8 +216,9 @@ def generate_output_path(input_cdes_file: str, output_dir: str, output_suffix: s
     return out_cdes_fname.absolute()
 
 
+@lru_cache(maxsize=2)
 def load_glove_model(model_name="glove-wiki-gigaword-50"):
-    """Load a GloVe model from disk.
+    """Load a GloVe model from disk, once per model name.
 
     Parameters
     ----------
@@ -144,8 +233,9 @@ def load_glove_model(model_name="glove-wiki-gigaword-50"):
     return api.load(model_name)
 
 
+@lru_cache(maxsize=2)
 def load_c2v_model(model_name="eng_50"):
-    """Load a chars2vec model from disk.
+    """Load a chars2vec model from disk, once per model name.
 
     Parameters
     ----------